@@ -0,0 +1,104 @@
+"""
+Shared helpers for the WTForms benchmarks.
+
+Benchmarks are plain functions registered with the `benchmark` decorator.
+Each one performs any setup it needs and returns a zero-argument callable
+which performs the operation being measured.
+"""
+import gc
+import sys
+from timeit import default_timer
+
+try:
+    import tracemalloc
+except ImportError:
+    tracemalloc = None
+
+REGISTRY = []
+
+
+def benchmark(name):
+    """
+    Register the decorated setup function as the benchmark `name`.
+    """
+    def _inner(func):
+        REGISTRY.append((name, func))
+        return func
+    return _inner
+
+
+class DummyPostData(dict):
+    def getlist(self, key):
+        v = self[key]
+        if not isinstance(v, (list, tuple)):
+            v = [v]
+        return v
+
+
+def time_op(op, min_time=0.5, repeat=3):
+    """
+    Time `op`, returning the best `(iterations, seconds)` of `repeat` rounds.
+
+    Each round calls `op` in batches until at least `min_time` seconds have
+    passed.
+    """
+    best = None
+    for _ in range(repeat):
+        iterations = 0
+        batch = 1
+        gc_enabled = gc.isenabled()
+        gc.disable()
+        try:
+            start = default_timer()
+            while True:
+                for _ in range(batch):
+                    op()
+                iterations += batch
+                elapsed = default_timer() - start
+                if elapsed >= min_time:
+                    break
+                batch *= 2
+        finally:
+            if gc_enabled:
+                gc.enable()
+        if best is None or iterations / elapsed > best[0] / best[1]:
+            best = (iterations, elapsed)
+    return best
+
+
+def measure_allocations(op):
+    """
+    Return the peak number of bytes allocated during a single call to `op`,
+    or `None` if `tracemalloc` is not available.
+    """
+    if tracemalloc is None:
+        return None
+    op()
+    tracemalloc.start()
+    try:
+        baseline = tracemalloc.get_traced_memory()[0]
+        op()
+        peak = tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+    return peak - baseline
+
+
+def run(name, setup, min_time=0.5, repeat=3):
+    """
+    Run a single registered benchmark, returning a dict of results.
+    """
+    op = setup()
+    op()
+    iterations, seconds = time_op(op, min_time, repeat)
+    return {
+        'name': name,
+        'iterations': iterations,
+        'seconds': seconds,
+        'ops_per_sec': iterations / seconds,
+        'peak_bytes': measure_allocations(op),
+    }
+
+
+def python_version():
+    return '.'.join(str(x) for x in sys.version_info[:3])
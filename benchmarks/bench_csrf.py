@@ -0,0 +1,74 @@
+from datetime import timedelta
+
+from wtforms.ext.csrf.session import SessionSecureForm
+from wtforms.ext.csrf.signed import SignedSecureForm
+from wtforms.fields import TextField
+
+from base import benchmark
+
+
+@benchmark('session_csrf_token')
+def session_csrf_token():
+    class F(SessionSecureForm):
+        SECRET_KEY = b'abcdefghijklmnop'
+        name = TextField()
+
+    form = F(csrf_context={})
+    session = {'csrf': '00e9fa5fe507251ac5f32b1608e9282f75156a05'}
+    return lambda: form.generate_csrf_token(session)
+
+
+@benchmark('session_csrf_compact')
+def session_csrf_compact():
+    class F(SessionSecureForm):
+        SECRET_KEY = b'abcdefghijklmnop'
+        TIME_GRANULARITY = timedelta(minutes=1)
+        COMPACT_TOKENS = True
+        name = TextField()
+
+    session = {'csrf': '00e9fa5fe507251ac5f32b1608e9282f75156a05'}
+    form = F(csrf_context=session)
+    form.csrf_token.data = form.csrf_token.current_token
+
+    def generate_and_validate():
+        form.generate_csrf_token(session)
+        form.validate_csrf_token(form.csrf_token)
+    return generate_and_validate
+
+
+@benchmark('signed_csrf_validate')
+def signed_csrf_validate():
+    class F(SignedSecureForm):
+        SECRET_KEYS = [b'ponmlkjihgfedcba', b'abcdefghijklmnop']
+        name = TextField()
+
+    form = F(csrf_context='user1')
+    form.csrf_token.data = form.csrf_token.current_token
+
+    def generate_and_validate():
+        form.generate_csrf_token('user1')
+        form.validate_csrf_token(form.csrf_token)
+    return generate_and_validate
+
+
+@benchmark('session_csrf_validate')
+def session_csrf_validate():
+    class F(SessionSecureForm):
+        SECRET_KEY = b'abcdefghijklmnop'
+        name = TextField()
+
+    session = {'csrf': '00e9fa5fe507251ac5f32b1608e9282f75156a05'}
+    form = F(csrf_context=session)
+    form.csrf_token.data = form.csrf_token.current_token
+    return lambda: form.validate_csrf_token(form.csrf_token)
+
+
+@benchmark('secure_form_data')
+def secure_form_data():
+    class F(SessionSecureForm):
+        SECRET_KEY = b'abcdefghijklmnop'
+
+    for i in range(20):
+        setattr(F, 'field%d' % i, TextField())
+    form = F(csrf_context={})
+    return lambda: form.data
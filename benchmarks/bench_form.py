@@ -0,0 +1,171 @@
+from wtforms import validators
+from wtforms.fields import TextField, IntegerField, FieldList, FormField
+from wtforms.form import Form
+from wtforms.columnar import validate_columns
+from wtforms.parallel import validate_parallel
+
+from base import benchmark, DummyPostData
+
+NUM_FIELDS = 40
+
+
+def make_wide_form(num_fields=NUM_FIELDS):
+    attrs = {}
+    for i in range(num_fields):
+        if i % 2:
+            attrs['field_%d' % i] = IntegerField(validators=[validators.Optional(), validators.NumberRange(min=0)])
+        else:
+            attrs['field_%d' % i] = TextField(validators=[validators.DataRequired(), validators.Length(max=50)])
+    return type(str('WideForm'), (Form, ), attrs)
+
+
+def make_wide_formdata(num_fields=NUM_FIELDS):
+    data = {}
+    for i in range(num_fields):
+        data['field_%d' % i] = [str(i) if i % 2 else 'value %d' % i]
+    return DummyPostData(data)
+
+
+# Module level, so worker processes can import it.
+WideForm = make_wide_form()
+
+
+@benchmark('form_init')
+def form_init():
+    F = make_wide_form()
+    formdata = make_wide_formdata()
+    return lambda: F(formdata)
+
+
+@benchmark('form_process')
+def form_process():
+    form = make_wide_form()()
+    formdata = make_wide_formdata()
+    return lambda: form.process(formdata)
+
+
+@benchmark('form_validate')
+def form_validate():
+    form = make_wide_form()(make_wide_formdata())
+    return form.validate
+
+
+@benchmark('form_validate_rows')
+def form_validate_rows():
+    F = make_wide_form()
+    rows = [make_wide_formdata() for i in range(100)]
+
+    def validate_rows():
+        for row in rows:
+            form = F(row)
+            form.validate()
+            form.data, form.errors
+    return validate_rows
+
+
+@benchmark('form_validate_many')
+def form_validate_many():
+    F = make_wide_form()
+    rows = [make_wide_formdata() for i in range(100)]
+    return lambda: F.validate_many(rows)
+
+
+@benchmark('form_validate_parallel')
+def form_validate_parallel():
+    rows = [dict(make_wide_formdata()) for i in range(2000)]
+    return lambda: validate_parallel(WideForm, rows, chunk_size=250)
+
+
+@benchmark('form_validate_columns')
+def form_validate_columns():
+    F = make_wide_form()
+    columns = {}
+    for i in range(NUM_FIELDS):
+        value = i if i % 2 else 'value %d' % i
+        columns['field_%d' % i] = [value] * 100
+    return lambda: validate_columns(F, columns)
+
+
+@benchmark('fieldlist_process')
+def fieldlist_process():
+    class Row(Form):
+        name = TextField(validators=[validators.DataRequired()])
+        quantity = IntegerField()
+
+    class F(Form):
+        rows = FieldList(FormField(Row))
+
+    data = {}
+    for i in range(300):
+        data['rows-%d-name' % i] = ['row %d' % i]
+        data['rows-%d-quantity' % i] = [str(i)]
+    formdata = DummyPostData(data)
+    form = F()
+    return lambda: form.process(formdata)
+
+
+@benchmark('fieldlist_many_keys')
+def fieldlist_many_keys():
+    attrs = {}
+    for i in range(10):
+        attrs['list_%d' % i] = FieldList(TextField())
+    F = type(str('ListsForm'), (Form, ), attrs)
+
+    data = {}
+    for i in range(10):
+        for j in range(5):
+            data['list_%d-%d' % (i, j)] = ['value']
+    for i in range(20000):
+        data['other-%d' % i] = ['x']
+    formdata = DummyPostData(data)
+    form = F()
+    return lambda: form.process(formdata)
+
+
+@benchmark('query_select_validate')
+def query_select_validate():
+    from wtforms.ext.sqlalchemy.fields import QuerySelectField, QuerySelectMultipleField
+
+    class Obj(object):
+        def __init__(self, id):
+            self.id = id
+
+    objects = [Obj(i) for i in range(2000)]
+
+    class F(Form):
+        one = QuerySelectField(get_pk=lambda obj: obj.id, query_factory=lambda: objects)
+        many = QuerySelectMultipleField(get_pk=lambda obj: obj.id, query_factory=lambda: objects)
+
+    formdata = DummyPostData({'one': ['1500'], 'many': [str(i) for i in range(0, 2000, 20)]})
+    form = F()
+
+    def validate():
+        form.process(formdata)
+        form.validate()
+    return validate
+
+
+@benchmark('i18n_form_errors')
+def i18n_form_errors():
+    from wtforms.ext.i18n.form import Form as I18NForm
+
+    class F(I18NForm):
+        LANGUAGES = ['en_US']
+        a = IntegerField()
+        b = IntegerField()
+        c = IntegerField()
+
+    formdata = DummyPostData({'a': ['x'], 'b': ['y'], 'c': ['z']})
+
+    def validate():
+        form = F(formdata)
+        form.validate()
+    return validate
+
+
+@benchmark('i18n_get_translations')
+def i18n_get_translations():
+    from wtforms.ext.i18n.utils import get_translations, preload_translations
+
+    preload_translations()
+    return lambda: get_translations(['es_ES', 'en'])
@@ -0,0 +1,105 @@
+from wtforms import validators
+from wtforms.validators import ValidationError
+
+from base import benchmark
+
+
+class DummyTranslations(object):
+    def gettext(self, string):
+        return string
+
+    def ngettext(self, singular, plural, n):
+        if n == 1:
+            return singular
+        return plural
+
+
+class DummyField(object):
+    _translations = DummyTranslations()
+
+    def __init__(self, data):
+        self.data = data
+        self.raw_data = [data]
+        self.errors = []
+
+    def gettext(self, string):
+        return self._translations.gettext(string)
+
+    def ngettext(self, singular, plural, n):
+        return self._translations.ngettext(singular, plural, n)
+
+
+def run_validators(cases):
+    """
+    Return a function calling each `(validator, value)` pair of `cases`,
+    catching validation errors.
+    """
+    fields = [(validator, DummyField(value)) for validator, value in cases]
+
+    def run():
+        for validator, field in fields:
+            try:
+                validator(None, field)
+            except ValueError:
+                pass
+    return run
+
+
+VALID = [
+    (validators.Length(min=2, max=50), 'a valid value'),
+    (validators.NumberRange(min=0, max=100), 42),
+    (validators.Email(), 'someone@example.com'),
+    (validators.URL(), 'http://example.com/path'),
+    (validators.UUID(), '2bc1c94f-0deb-43e9-92a1-4775189ec9f8'),
+    (validators.MacAddress(), '01:23:45:67:ab:CD'),
+    (validators.IPAddress(), '192.168.100.200'),
+    (validators.IPAddress(ipv6=True), 'dead:beef:0:0:0:0:42:1'),
+    (validators.AnyOf(['a', 'b', 'c']), 'b'),
+    (validators.NoneOf(['a', 'b', 'c']), 'd'),
+]
+
+INVALID = [
+    (validators.Length(min=2, max=50), 'a'),
+    (validators.NumberRange(min=0, max=100), 101),
+    (validators.Email(), 'someone'),
+    (validators.URL(), 'example'),
+    (validators.UUID(), '2bc1c94f'),
+    (validators.MacAddress(), '01:23:45'),
+    (validators.IPAddress(), '192.168.100.300'),
+    (validators.IPAddress(ipv6=True), 'dead:beef::0::1'),
+    (validators.AnyOf(['a', 'b', 'c']), 'd'),
+    (validators.NoneOf(['a', 'b', 'c']), 'a'),
+]
+
+
+@benchmark('validators_valid')
+def validators_valid():
+    return run_validators(VALID * 10)
+
+
+@benchmark('validators_invalid')
+def validators_invalid():
+    return run_validators(INVALID * 10)
+
+
+@benchmark('ip_address')
+def ip_address():
+    validator = validators.IPAddress(ipv6=True)
+    values = ['10.0.0.%d' % i for i in range(50)] + ['fe80::%x' % i for i in range(50)]
+    return lambda: [validator.is_valid(value) for value in values]
+
+
+@benchmark('regexp_dynamic_forms')
+def regexp_dynamic_forms():
+    # Like generating forms per request, with more patterns than the re
+    # module caches on some versions.
+    patterns = [r'^[a-z]{%d,%d}$' % (i, i + 10) for i in range(200)]
+
+    def make_validators():
+        for pattern in patterns:
+            validators.Regexp(pattern)
+        validators.Email()
+        validators.URL()
+        validators.UUID()
+        validators.MacAddress()
+    return make_validators
@@ -0,0 +1,62 @@
+from wtforms import widgets
+from wtforms.fields import Choices, SelectField
+from wtforms.form import Form
+
+from base import benchmark
+
+NUM_CHOICES = 3000
+
+
+def make_choices():
+    return [('sku-%d' % i, 'Product <%d> & co' % i) for i in range(NUM_CHOICES)]
+
+
+def make_select_form(**kwargs):
+    class F(Form):
+        sku = SelectField(**kwargs)
+
+    return F(sku='sku-1500')
+
+
+@benchmark('select_render')
+def select_render():
+    return make_select_form(choices=make_choices()).sku
+
+
+@benchmark('select_render_cached')
+def select_render_cached():
+    return make_select_form(choices=make_choices(), widget=widgets.Select(cache_options=True)).sku
+
+
+@benchmark('select_render_choices')
+def select_render_choices():
+    return make_select_form(choices=Choices(make_choices())).sku
+
+
+@benchmark('form_render')
+def form_render():
+    from bench_form import make_wide_form, make_wide_formdata
+
+    form = make_wide_form()(make_wide_formdata())
+
+    def render():
+        return ''.join('%s %s' % (field.label(), field(class_='input')) for field in form)
+    return render
+
+
+@benchmark('form_render_table')
+def form_render_table():
+    from bench_form import make_wide_form, make_wide_formdata
+
+    form = make_wide_form()(make_wide_formdata())
+    widget = widgets.TableWidget(with_table_tag=False)
+    return lambda: widget(form)
+
+
+@benchmark('form_render_table_cached')
+def form_render_table_cached():
+    from bench_form import make_wide_form, make_wide_formdata
+
+    form = make_wide_form()(make_wide_formdata())
+    widget = widgets.TableWidget(with_table_tag=False, cache_template=True)
+    return lambda: widget(form)
@@ -0,0 +1,68 @@
+#!/usr/bin/env python
+"""
+Run the WTForms benchmarks and print the results as JSON.
+
+Usage::
+
+    python benchmarks/runner.py [-o results.json] [-t min_time] [name ...]
+
+If benchmark names are given, only those benchmarks are run.
+"""
+import datetime
+import json
+import os
+import sys
+from optparse import OptionParser
+
+BENCHMARKS = ('bench_form', 'bench_widgets', 'bench_csrf', 'bench_validators')
+
+
+def main():
+    parser = OptionParser(usage='%prog [options] [name ...]')
+    parser.add_option('-o', '--output', help='write JSON results to this file instead of stdout')
+    parser.add_option('-t', '--min-time', type='float', default=0.5,
+                      help='minimum seconds to run each timing round [default: %default]')
+    parser.add_option('-r', '--repeat', type='int', default=3,
+                      help='number of timing rounds, the best is kept [default: %default]')
+    parser.add_option('-l', '--list', action='store_true', help='list benchmark names and exit')
+    options, names = parser.parse_args()
+
+    here = os.path.abspath(os.path.dirname(__file__))
+    sys.path.insert(0, os.path.join(here, '..'))
+    sys.path.insert(0, here)
+
+    import wtforms
+    from base import REGISTRY, run, python_version
+    for module in BENCHMARKS:
+        __import__(module)
+
+    if options.list:
+        for name, _ in REGISTRY:
+            print(name)
+        return
+
+    unknown = set(names) - set(name for name, _ in REGISTRY)
+    if unknown:
+        parser.error('unknown benchmark(s): %s' % ', '.join(sorted(unknown)))
+
+    results = []
+    for name, setup in REGISTRY:
+        if not names or name in names:
+            results.append(run(name, setup, options.min_time, options.repeat))
+            sys.stderr.write('%-30s %12.1f ops/sec\n' % (name, results[-1]['ops_per_sec']))
+
+    output = json.dumps({
+        'python': python_version(),
+        'wtforms': wtforms.__version__,
+        'timestamp': datetime.datetime.utcnow().strftime('%Y-%m-%dT%H:%M:%SZ'),
+        'results': results,
+    }, indent=2, sort_keys=True)
+
+    if options.output:
+        with open(options.output, 'w') as f:
+            f.write(output + '\n')
+    else:
+        print(output)
+
+if __name__ == '__main__':
+    main()
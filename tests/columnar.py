@@ -0,0 +1,75 @@
+#!/usr/bin/env python
+from __future__ import unicode_literals
+
+from unittest import TestCase
+
+from wtforms.columnar import validate_columns
+from wtforms.fields import TextField, IntegerField, SelectField, FormField
+from wtforms.form import Form
+from wtforms.validators import (
+    ValidationError, any_of, data_required, equal_to, length, none_of,
+    number_range, optional, regexp, required
+)
+
+
+class DummyPostData(dict):
+    def getlist(self, key):
+        v = self[key]
+        if not isinstance(v, (list, tuple)):
+            v = [v]
+        return v
+
+
+class F(Form):
+    name = TextField(validators=[required(), length(min=2, max=5), none_of(['admin'])])
+    code = TextField(validators=[optional(), regexp(r'^[A-Z]+$'), any_of(['AB', 'CD'])])
+    count = IntegerField(validators=[data_required(), number_range(min=1, max=10)])
+
+
+class ValidateColumnsTest(TestCase):
+    def test_matches_form(self):
+        columns = {
+            'name': ['bob', '', None, 'x', 'toolong', 'admin', '  '],
+            'code': ['AB', None, 'ab', 'EF', '', 'CD', 'Q'],
+            'count': [1, 0, 5, 11, None, 10, -1],
+        }
+        results = validate_columns(F, columns)
+        for index in range(7):
+            form = F(**dict((name, column[index]) for name, column in columns.items()))
+            for field in form:
+                field.raw_data = field.data is not None and [field.data] or []
+            form.validate()
+            self.assertEqual(results.get(index, {}), form.errors)
+        self.assertTrue(0 not in results)
+        self.assertEqual(results[1], {'name': ['This field is required.'], 'count': ['This field is required.']})
+
+    def test_fallback(self):
+        class G(Form):
+            a = TextField(validators=[length(max=3)])
+            b = TextField(validators=[equal_to('a')])
+            c = SelectField(choices=[('x', 'X')])
+
+            def validate_a(form, field):
+                if field.data == 'bad':
+                    raise ValidationError('inline')
+
+        results = validate_columns(G, {'a': ['ok', 'bad', 'long'], 'b': ['ok', 'bad', 'no'], 'c': ['x', 'x', 'y']})
+        self.assertEqual(sorted(results), [1, 2])
+        self.assertEqual(results[1], {'a': ['inline']})
+        self.assertEqual(results[2]['a'], ['Field cannot be longer than 3 characters.'])
+        self.assertEqual(sorted(results[2]), ['a', 'b', 'c'])
+
+    def test_field_named_many(self):
+        class G(Form):
+            many = TextField(validators=[length(max=3)])
+
+        self.assertEqual(validate_columns(G, {'many': ['ok', 'long']}), {1: {'many': ['Field cannot be longer than 3 characters.']}})
+
+    def test_columns(self):
+        self.assertEqual(validate_columns(F, {}), {})
+        self.assertEqual(sorted(validate_columns(F, {'code': [None, None]})), [0, 1])
+        self.assertRaises(ValueError, validate_columns, F, {'name': ['a'], 'count': [1, 2]})
+
+        class G(Form):
+            inner = FormField(F)
+        self.assertRaises(TypeError, validate_columns, G, {})
@@ -4,7 +4,8 @@ from unittest import TestCase
 
 from wtforms.fields import TextField
 from wtforms.ext.csrf import SecureForm
-from wtforms.ext.csrf.session import SessionSecureForm
+from wtforms.ext.csrf.session import SessionSecureForm, clear_token_cache
+from wtforms.ext.csrf.signed import SignedSecureForm
 
 import datetime
 import hashlib
@@ -86,6 +87,14 @@ class SessionSecureFormTest(TestCase):
         SECRET_KEY = 'abcdefghijklmnop'.encode('ascii')
         TIME_LIMIT = None
 
+    class CompactSSF(SessionSecureForm):
+        SECRET_KEY = 'abcdefghijklmnop'.encode('ascii')
+        TIME_GRANULARITY = datetime.timedelta(minutes=5)
+        COMPACT_TOKENS = True
+
+    class BadTimeCompactSSF(CompactSSF):
+        TIME_LIMIT = datetime.timedelta(-1)
+
     def test_basic(self):
         self.assertRaises(Exception, SessionSecureForm)
         self.assertRaises(TypeError, self.SSF)
@@ -128,3 +137,98 @@ class SessionSecureFormTest(TestCase):
 
         form = self.NoTimeSSF(postdata, csrf_context=session)
         assert form.validate()
+
+    def test_malformed(self):
+        session = {}
+        token = self.SSF(csrf_context=session).csrf_token._value()
+        for bad_token in (token + '##' + token, 'fake##\u2603'):
+            form = self.SSF(DummyPostData(csrf_token=bad_token), csrf_context=session)
+            assert not form.validate()
+            self.assertEqual(form.csrf_token.errors, ['CSRF failed'])
+
+    def test_compact(self):
+        session = {}
+        form = self.CompactSSF(csrf_context=session)
+        token = form.csrf_token._value()
+        expires = token.split('##')[0]
+        assert expires.isdigit()
+        self.assertEqual(int(expires) % 300, 0)
+        self.assertEqual(self.CompactSSF(csrf_context=session).csrf_token._value(), token)
+
+        form = self.CompactSSF(DummyPostData(csrf_token=token), csrf_context=session)
+        assert form.validate()
+
+        bad_token = self.BadTimeCompactSSF(csrf_context=session).csrf_token._value()
+        form = self.CompactSSF(DummyPostData(csrf_token=bad_token), csrf_context=session)
+        assert not form.validate()
+        self.assertEqual(form.csrf_token.errors[0], 'CSRF token expired')
+
+        # Tokens in the other format don't validate, even with a valid hmac.
+        for other_token in (self.SSF(csrf_context=session).csrf_token._value(), '##' + token.split('##')[1]):
+            form = self.CompactSSF(DummyPostData(csrf_token=other_token), csrf_context=session)
+            assert not form.validate()
+            self.assertEqual(form.csrf_token.errors[0], 'CSRF failed')
+
+    def test_token_cache(self):
+        clear_token_cache()
+        session = {'csrf': '00e9fa5fe507251ac5f32b1608e9282f75156a05'}
+        form = self.NoTimeSSF(csrf_context=session)
+        self.assertEqual(form.csrf_token._value(), '##d21f54b7dd2041fab5f8d644d4d3690c77beeb14')
+
+        class OtherKeySSF(self.NoTimeSSF):
+            SECRET_KEY = 'ponmlkjihgfedcba'.encode('ascii')
+        other_token = OtherKeySSF(csrf_context=session).csrf_token._value()
+        self.assertNotEqual(other_token, form.csrf_token._value())
+
+        session['csrf'] = 'ff' + session['csrf'][2:]
+        self.assertNotEqual(self.NoTimeSSF(csrf_context=session).csrf_token._value(), form.csrf_token._value())
+        clear_token_cache()
+
+
+class SignedSecureFormTest(TestCase):
+    class SSF(SignedSecureForm):
+        SECRET_KEYS = ['abcdefghijklmnop'.encode('ascii')]
+
+    class RotatedSSF(SignedSecureForm):
+        SECRET_KEYS = ['ponmlkjihgfedcba'.encode('ascii'), 'abcdefghijklmnop'.encode('ascii')]
+
+    class ExpiredSSF(SSF):
+        TIME_LIMIT = datetime.timedelta(-1, 86300)
+
+    def test_basic(self):
+        self.assertRaises(Exception, SignedSecureForm, csrf_context='user1')
+        self.assertRaises(TypeError, self.SSF)
+        form = self.SSF(csrf_context='user1')
+        timestamp, digest = form.csrf_token._value().split('##')
+        assert timestamp.isdigit()
+        hmacced = hmac.new(form.SECRET_KEYS[0], ('%s:user1' % timestamp).encode('utf8'), digestmod=hashlib.sha1)
+        self.assertEqual(digest, hmacced.hexdigest())
+
+    def test_validate(self):
+        token = self.SSF(csrf_context='user1').csrf_token._value()
+        assert self.SSF(DummyPostData(csrf_token=token), csrf_context='user1').validate()
+
+        for bad_token, context, error in [
+            ('', 'user1', 'CSRF token missing'),
+            ('fake##fake', 'user1', 'CSRF failed'),
+            (token, 'user2', 'CSRF failed'),
+        ]:
+            form = self.SSF(DummyPostData(csrf_token=bad_token), csrf_context=context)
+            assert not form.validate()
+            self.assertEqual(form.csrf_token.errors[0], error)
+
+        # The time limit is applied when validating.
+        form = self.ExpiredSSF(DummyPostData(csrf_token=token), csrf_context='user1')
+        assert not form.validate()
+        self.assertEqual(form.csrf_token.errors[0], 'CSRF token expired')
+
+    def test_key_rotation(self):
+        old_token = self.SSF(csrf_context='user1').csrf_token._value()
+        form = self.RotatedSSF(DummyPostData(csrf_token=old_token), csrf_context='user1')
+        assert form.validate()
+        self.assertNotEqual(form.csrf_token._value().split('##')[1], old_token.split('##')[1])
+
+        new_token = form.csrf_token._value()
+        form = self.SSF(DummyPostData(csrf_token=new_token), csrf_context='user1')
+        assert not form.validate()
+        self.assertEqual(form.csrf_token.errors[0], 'CSRF failed')
@@ -1,7 +1,11 @@
 from __future__ import unicode_literals
 
 from unittest import TestCase
-from wtforms.ext.i18n.utils import get_translations
+from wtforms.ext.i18n import utils
+from wtforms.ext.i18n.utils import get_translations, preload_translations
+from wtforms.ext.i18n import form as i18n_form
+from wtforms.fields import TextField
+from wtforms.fields.core import CachedTranslations
 
 class I18NTest(TestCase):
     def test_failure(self):
@@ -11,6 +15,41 @@ class I18NTest(TestCase):
         translations = get_translations(['en_US'])
         self.assertEqual(translations.gettext('Invalid Mac address.'), 'Invalid MAC address.')
 
+    def test_cached_messages(self):
+        class F(i18n_form.Form):
+            LANGUAGES = ['en_US']
+            a = TextField()
+
+        translations = F().a._translations
+        self.assertTrue(isinstance(translations, CachedTranslations))
+        self.assertTrue(F().a._translations is translations)
+        self.assertEqual(translations.gettext('Invalid Mac address.'), 'Invalid MAC address.')
+        self.assertEqual(translations.gettext('Invalid Mac address.'), 'Invalid MAC address.')
+        self.assertTrue(translations.cache_info().hits >= 1)
+
+    def test_preload(self):
+        messages = ['Invalid Mac address.', 'Not a valid choice', 'This field is required.']
+        language_lists = [['en_US.UTF-8', 'de', 'es'], ['es'], ['de', 'it_IT'], ['zh']]
+        expected = [[get_translations(l).gettext(m) for m in messages] for l in language_lists]
+
+        languages = preload_translations()
+        try:
+            self.assertTrue('en' in languages and 'es' in languages)
+            translation = utils.gettext.translation
+            utils.gettext.translation = None
+            try:
+                for language_list, expected_messages in zip(language_lists, expected):
+                    translations = get_translations(language_list)
+                    self.assertEqual([translations.gettext(m) for m in messages], expected_messages)
+            finally:
+                utils.gettext.translation = translation
+
+            # Languages without an included catalog are looked up by gettext.
+            self.assertRaises(IOError, get_translations, ['xx'])
+            self.assertRaises(IOError, get_translations, [])
+        finally:
+            utils._preloaded = None
+
 
 if __name__ == '__main__':
     from unittest import main
@@ -1,10 +1,10 @@
 #!/usr/bin/env python
 from __future__ import unicode_literals
 
-from sqlalchemy import create_engine, ForeignKey
+from sqlalchemy import create_engine, event, ForeignKey
 from sqlalchemy.schema import MetaData, Table, Column
 from sqlalchemy.types import String, Integer, Date
-from sqlalchemy.orm import sessionmaker, relationship, backref
+from sqlalchemy.orm import sessionmaker, relationship, backref, scoped_session
 from sqlalchemy.ext.declarative import declarative_base
 
 from unittest import TestCase
@@ -13,7 +13,7 @@ from wtforms.compat import text_type, iteritems
 from wtforms.ext.sqlalchemy.fields import QuerySelectField, QuerySelectMultipleField
 from wtforms.form import Form
 from wtforms.fields import TextField
-from wtforms.ext.sqlalchemy.orm import model_form
+from wtforms.ext.sqlalchemy.orm import model_form, clear_model_form_cache, ModelConverter
 from wtforms.validators import Optional, Required, Length
 from wtforms.ext.sqlalchemy.validators import Unique
 
@@ -70,7 +70,7 @@ class TestBase(TestCase):
 
 class QuerySelectFieldTest(TestBase):
     def setUp(self):
-        engine = create_engine('sqlite:///:memory:', echo=False)
+        engine = self.engine = create_engine('sqlite:///:memory:', echo=False)
         self.Session = sessionmaker(bind=engine)
         from sqlalchemy.orm import mapper
         self._do_tables(mapper, engine)
@@ -118,6 +118,62 @@ class QuerySelectFieldTest(TestBase):
         self.assertEqual(form.a(), [('1', 'apple', True), ('2', 'banana', False), ('3', 'meh', False)])
 
 
+    def test_fetch_submitted(self):
+        sess = self.Session()
+        self._fill(sess)
+
+        class F(Form):
+            a = QuerySelectField(get_label='name', query_factory=lambda: sess.query(self.Test),
+                widget=LazySelect(), fetch_submitted=True)
+            b = QuerySelectMultipleField(get_label='baz', query_factory=lambda: sess.query(self.PKTest),
+                widget=LazySelect(), fetch_submitted=True)
+
+        form = F(DummyPostData(a=['2'], b=['hello2', 'hello1']))
+        self.assertEqual(form.a.data.name, 'banana')
+        self.assertEqual([x.baz for x in form.b.data], ['apple', 'banana'])
+        self.assertTrue(form.validate())
+        self.assertEqual(form.a._object_list, None)
+
+        sess.add(self.Test(id=3, name='meh'))
+        sess.flush()
+        self.assertEqual(form.a(), [('1', 'apple', False), ('2', 'banana', True), ('3', 'meh', False)])
+
+        form = F(DummyPostData(a=['4'], b=['hello1', 'hello3']))
+        self.assertEqual(form.a.data, None)
+        self.assertEqual([x.baz for x in form.b.data], ['apple'])
+        self.assertFalse(form.validate())
+        self.assertEqual(sorted(form.errors), ['a', 'b'])
+
+    def test_fetch_submitted_queries(self):
+        sess = self.Session()
+        self._fill(sess)
+        factory_calls = []
+        statements = []
+        event.listen(self.engine, 'before_cursor_execute', lambda conn, cursor, statement, *args: statements.append(statement))
+
+        def query_factory():
+            factory_calls.append(1)
+            return sess.query(self.Test)
+
+        class F(Form):
+            a = QuerySelectField(get_label='name', query_factory=query_factory, widget=LazySelect(), fetch_submitted=True)
+
+        form = F(DummyPostData(a=['2']))
+        self.assertTrue(form.validate())
+        self.assertEqual(form.a.data.name, 'banana')
+        self.assertEqual((len(factory_calls), len(statements)), (1, 1))
+
+        # Keys which aren't numbers are invalid choices, and aren't sent to
+        # the database.
+        for pk in ('x', '', '1.5'):
+            form = F(DummyPostData(a=[pk]))
+            self.assertFalse(form.validate())
+        self.assertEqual(len(statements), 1)
+
+        form = F(DummyPostData(a=['02']))
+        self.assertFalse(form.validate())
+
+
 class QuerySelectMultipleFieldTest(TestBase):
     def setUp(self):
         from sqlalchemy.orm import mapper
@@ -204,6 +260,7 @@ class ModelFormTest(TestCase):
         self.metadata = Model.metadata
         self.metadata.create_all(bind=engine)
         self.sess = Session()
+        self.scoped_sess = scoped_session(Session)
 
     def test_nullable_field(self):
         student_form = model_form(self.Student, self.sess)()
@@ -253,6 +310,56 @@ class ModelFormTest(TestCase):
         self.assertTrue(issubclass(QuerySelectMultipleField,
             student_form._fields['courses'].__class__))
 
+    def test_converter_dispatch(self):
+        converter = ModelConverter()
+        model_form(self.Student, self.sess, converter=converter)
+        info = converter.dispatch_info()
+        # The String and Date columns; the Integer keys are excluded.
+        self.assertEqual(info.currsize, 2)
+        self.assertEqual(info.misses, 2)
+        self.assertEqual(converter.get_converter(String), converter.conv_String)
+        self.assertEqual(converter.dispatch_info().hits, info.hits + 1)
+
+        model_form(self.School, self.sess, converter=converter)
+        self.assertEqual(converter.dispatch_info().misses, 2)
+
+        model_form(self.Student, self.sess, converter=converter, exclude_pk=False)
+        self.assertEqual(converter.dispatch_info().currsize, 3)
+
+        converter.converters['Date'] = converter.conv_String
+        self.assertEqual(converter.get_converter(Date), converter.conv_Date)
+        converter.clear_dispatch()
+        self.assertEqual(converter.dispatch_info(), (0, 0, 0))
+        self.assertEqual(converter.get_converter(Date), converter.conv_String)
+
+    def test_cache(self):
+        sess = self.scoped_sess
+        self.assertTrue(model_form(self.Student, sess) is not model_form(self.Student, sess))
+
+        form_class = model_form(self.Student, sess, cache=True)
+        self.assertTrue(model_form(self.Student, sess, cache=True) is form_class)
+        self.assertTrue(model_form(self.Student, sess, exclude_fk=False, cache=True) is not form_class)
+        self.assertTrue(model_form(self.Student, scoped_session(sessionmaker()), cache=True) is not form_class)
+
+        # Fields query through the session, so plain sessions aren't cached.
+        self.assertTrue(model_form(self.Student, self.sess, cache=True) is not model_form(self.Student, self.sess, cache=True))
+
+        field_args = {'full_name': {'label': 'Name', 'validators': [Length(max=10)]}}
+        with_args = model_form(self.Student, sess, field_args=field_args, cache=True)
+        self.assertTrue(model_form(self.Student, sess, field_args=field_args, cache=True) is with_args)
+        self.assertTrue(model_form(self.Student, sess, field_args={'full_name': {'label': 'Name'}}, cache=True) is not with_args)
+
+        exclude = ['dob']
+        excluded = model_form(self.Student, sess, exclude=exclude, cache=True)
+        self.assertEqual(exclude, ['dob'])
+        self.assertTrue(model_form(self.Student, sess, exclude=('dob', ), cache=True) is excluded)
+
+        school_form = model_form(self.School, sess, cache=True)
+        clear_model_form_cache(self.Student)
+        self.assertTrue(model_form(self.Student, sess, cache=True) is not form_class)
+        self.assertTrue(model_form(self.School, sess, cache=True) is school_form)
+        clear_model_form_cache()
+        self.assertTrue(model_form(self.School, sess, cache=True) is not school_form)
 
 class UniqueValidatorTest(TestCase):
     def setUp(self):
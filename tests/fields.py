@@ -230,6 +230,66 @@ class SelectFieldTest(TestCase):
         self.assertEqual(len(form.a.errors), 1)
         self.assertEqual(form.a.errors[0], 'Not a valid choice')
 
+    def test_choice_index(self):
+        form1 = self.F(DummyPostData(b=['2']))
+        form2 = self.F(DummyPostData(b=['3']))
+        self.assertTrue(form1.b.validate(form1))
+        self.assertFalse(form2.b.validate(form2))
+
+        # Only choices which can't change in place are indexed and shared.
+        self.assertEqual(form1.b._choice_index.values, None)
+        form1.b.choices = form2.b.choices = ((1, 'Item 1'), (2, 'Item 2'))
+        self.assertTrue(form1.b._get_choice_index() is form2.b._get_choice_index())
+        self.assertEqual(form1.b._choice_index.values, frozenset([1, 2]))
+        form1.b.choices = ([1, 'Item 1'], [2, 'Item 2'])
+        self.assertEqual(form1.b._get_choice_index().values, None)
+
+        # In-place changes to the length of a choices list are picked up.
+        choices = [(1, 'Item 1')]
+        form2.b.choices = choices
+        self.assertFalse(form2.b.validate(form2))
+        choices.append((3, 'Item 3'))
+        self.assertTrue(form2.b.validate(form2))
+        self.assertEqual(list(form2.b.iter_choices()), [(1, 'Item 1', False), (3, 'Item 3', True)])
+
+        # So are choices replaced in place.
+        choices = [('a', 'A'), ('b', 'B')]
+        form = make_form(a=SelectField(choices=choices))(DummyPostData(a=['c']))
+        self.assertFalse(form.validate())
+        choices[0] = ('c', 'C')
+        self.assertTrue(form.validate())
+        form.a.data = 'a'
+        self.assertFalse(form.validate())
+
+    def test_unhashable_choices(self):
+        F = make_form(a=SelectField(choices=[(['x'], 'X')], coerce=list))
+        form = F(a=['x'])
+        self.assertTrue(form.validate())
+        self.assertEqual(list(form.a.iter_choices()), [(['x'], 'X', True)])
+
+
+class ChoicesTest(TestCase):
+    choices = Choices([('a', 'A & a'), ('b', 'B')])
+
+    def test_immutable(self):
+        self.assertEqual(self.choices, (('a', 'A & a'), ('b', 'B')))
+        self.assertEqual(hash(self.choices), hash(Choices(self.choices)))
+        self.assertRaises(AttributeError, setattr, self.choices, 'x', 1)
+
+    def test_shared(self):
+        F = make_form(
+            a=SelectField(choices=self.choices),
+            b=SelectMultipleField(choices=self.choices),
+            c=RadioField(choices=self.choices),
+        )
+        form = F(DummyPostData(a='b', b=['a', 'b'], c='x'))
+        self.assertFalse(form.validate())
+        self.assertEqual(list(form.errors), ['c'])
+        self.assertTrue(form.a._get_choice_index() is form.b._get_choice_index())
+        self.assertEqual(form.a(), '<select id="a" name="a"><option value="a">A &amp; a</option><option selected value="b">B</option></select>')
+        self.assertEqual(form.b(), '<select id="b" multiple name="b"><option selected value="a">A &amp; a</option><option selected value="b">B</option></select>')
+        self.assertEqual(len(self.choices.rendered_options(widgets.Select.render_option)), 2)
+
 
 class SelectMultipleFieldTest(TestCase):
     class F(Form):
@@ -560,6 +620,50 @@ class FormFieldTest(TestCase):
 class FieldListTest(TestCase):
     t = TextField(validators=[validators.Required()])
 
+    def test_iter_render(self):
+        inner = make_form('inner', a=TextField(), b=HiddenField(), c=SelectField(choices=[('x', 'X'), ('y', 'Y')]))
+        F = make_form(rows=FieldList(FormField(inner)))
+        form = F(rows=[{'a': '<1>', 'b': 'h', 'c': 'y'}, {'a': '2'}])
+        chunks = list(form.rows.iter_render(class_='rows'))
+        self.assertTrue(len(chunks) > 10)
+        self.assertEqual(''.join(chunks), form.rows(class_='rows'))
+        self.assertEqual(list(form.rows.entries[0].a.iter_render()), [form.rows.entries[0].a()])
+
+    def test_iter_render_overrides(self):
+        class FancySelectField(SelectField):
+            def __call__(self, **kwargs):
+                kwargs.setdefault('class_', 'fancy')
+                return super(FancySelectField, self).__call__(**kwargs)
+
+        class WrappedSelect(widgets.Select):
+            def __call__(self, field, **kwargs):
+                return widgets.HTMLString('<div>%s</div>' % super(WrappedSelect, self).__call__(field, **kwargs))
+
+        choices = [('x', 'X')]
+        inner = make_form('inner', a=FancySelectField(choices=choices), b=SelectField(choices=choices, widget=WrappedSelect()))
+        F = make_form(rows=FieldList(FancySelectField(choices=choices), min_entries=1), sub=FormField(inner))
+        form = F()
+        for field in (form.rows, form.sub):
+            self.assertEqual(''.join(field.iter_render()), field())
+        self.assertTrue('class="fancy"' in form.rows())
+        self.assertTrue('class="fancy"' in form.sub())
+        self.assertTrue('<div><select' in form.sub())
+        self.assertEqual(list(form.sub.b.iter_render()), [form.sub.b()])
+
+    def test_iter_render_text_overrides(self):
+        class CustomFormField(FormField):
+            def __str__(self):
+                return '<custom>'
+            __unicode__ = __html__ = __str__
+
+        inner = make_form('inner', a=TextField())
+        F = make_form('F', sub=CustomFormField(inner), b=TextField())
+        for cache_template in (False, True):
+            form = make_form(outer=FormField(F, widget=widgets.TableWidget(cache_template=cache_template)))()
+            html = form.outer()
+            self.assertTrue('<td><custom></td>' in html)
+            self.assertEqual(''.join(form.outer.iter_render()), html)
+
     def test_form(self):
         F = make_form(a = FieldList(self.t))
         data = ['foo', 'hi', 'rawr']
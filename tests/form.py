@@ -3,9 +3,10 @@ from __future__ import unicode_literals
 
 from unittest import TestCase
 
-from wtforms.form import BaseForm, Form
-from wtforms.fields import TextField, IntegerField
-from wtforms.validators import ValidationError
+from wtforms.form import BaseForm, Form, DictInputWrapper, IndexedInputWrapper
+from wtforms.fields import TextField, IntegerField, FieldList, FormField
+from wtforms.fields.core import UnboundField, _unset_value
+from wtforms.validators import ValidationError, length, optional, required
 
 
 class DummyPostData(dict):
@@ -84,6 +85,80 @@ class BaseFormTest(TestCase):
         form = self.get_form()
         self.assertRaises(TypeError, form.process, [])
 
+    def test_lazy(self):
+        form = self.get_form(lazy=True)
+        form['other'] = TextField()
+        self.assertEqual(list(form._fields), ['other'])
+        form.process(DummyPostData(test=['foobar']))
+        self.assertTrue('test' in form)
+        self.assertEqual(list(form._fields), ['other'])
+        self.assertEqual(form['test'].data, 'foobar')
+        self.assertEqual(sorted(form._fields), ['other', 'test'])
+
+        form = self.get_form(lazy=True)
+        form.process(test='bar')
+        self.assertEqual(form.validate(), False)
+        self.assertEqual(form.errors, {'test': ['error']})
+
+        form = self.get_form(lazy=True)
+        del form['test']
+        self.assertTrue('test' not in form)
+        self.assertEqual(form.data, {})
+
+
+class DictInputWrapperTest(TestCase):
+    def test_getlist(self):
+        wrapper = DictInputWrapper({'a': 'x', 'b': ['y', 'z'], 'c': None, 'd': 0})
+        self.assertEqual(wrapper.getlist('a'), ['x'])
+        self.assertEqual(wrapper.getlist('b'), ['y', 'z'])
+        self.assertEqual(wrapper.getlist('c'), [])
+        self.assertEqual(wrapper.getlist('d'), [0])
+        self.assertEqual(wrapper.getlist('e'), [])
+        self.assertEqual(len(wrapper), 4)
+        self.assertTrue('a' in wrapper)
+
+
+class IndexedInputWrapperTest(TestCase):
+    def test_keys_with_prefix(self):
+        wrapper = IndexedInputWrapper(DummyPostData({'a-1': ['x'], 'a-0-b': ['y'], 'ab': ['z'], 'b-0': ['w']}))
+        self.assertEqual(wrapper.keys_with_prefix('a'), ['a-0-b', 'a-1', 'ab'])
+        self.assertEqual(wrapper.keys_with_prefix('a-'), ['a-0-b', 'a-1'])
+        self.assertEqual(wrapper.keys_with_prefix('c'), [])
+        self.assertTrue('ab' in wrapper)
+        self.assertEqual(wrapper.getlist('b-0'), ['w'])
+        self.assertEqual(len(wrapper), 4)
+        self.assertEqual(wrapper.get('ab'), ['z'])
+        self.assertFalse(IndexedInputWrapper(DummyPostData()))
+
+    def test_process(self):
+        class Inner(Form):
+            b = FieldList(TextField())
+
+        class F(Form):
+            a = FieldList(FormField(Inner))
+            c = TextField()
+
+        formdata = DummyPostData({'a-0-b-0': ['x'], 'a-0-b-1': ['y'], 'a-1-b-0': ['z'], 'c': ['w']})
+        form = F(formdata)
+        self.assertEqual(form.data, {'a': [{'b': ['x', 'y']}, {'b': ['z']}], 'c': 'w'})
+        self.assertFalse(BaseForm([('c', TextField())])._wants_indexed_formdata())
+        self.assertTrue(form._wants_indexed_formdata())
+
+    def test_custom_field(self):
+        class ItemField(TextField):
+            def process(self, formdata, data=_unset_value):
+                super(ItemField, self).process(formdata, data)
+                self.data = formdata[self.name][0]
+                self.other = formdata.get('a-0')
+
+        class F(Form):
+            a = FieldList(TextField())
+            b = ItemField()
+
+        form = F(DummyPostData({'a-0': ['x'], 'b': ['y', 'z']}))
+        self.assertEqual(form.data, {'a': ['x'], 'b': 'y'})
+        self.assertEqual(form.b.other, ['x'])
+
 
 class FormMetaTest(TestCase):
     def test_monkeypatch(self):
@@ -117,6 +192,141 @@ class FormMetaTest(TestCase):
         self.assertEqual(A._unbound_fields, [('a', A.a), ('c', A.c)])
         self.assertEqual(B._unbound_fields, [('a', B.a), ('b', B.b), ('c', B.c)])
 
+class FormPlanTest(TestCase):
+    class F(Form):
+        a = TextField(validators=[required()])
+        b = IntegerField()
+
+    def test_prototypes_reused(self):
+        class G(self.F):
+            pass
+        form1 = G(prefix='x')
+        plan = G._plan
+        self.assertEqual(list(plan), G._unbound_fields)
+        form2 = G(DummyPostData(**{'x-a': ['hello']}), prefix='x')
+        self.assertTrue(G._plan is plan)
+        self.assertEqual(len(plan._prototypes), 1)
+        self.assertEqual(form2.a.name, 'x-a')
+        self.assertEqual(form2.a.data, 'hello')
+        self.assertEqual(form1.a.data, None)
+        self.assertTrue(form2.a.flags.required)
+        G(prefix='y')
+        self.assertEqual(len(plan._prototypes), 2)
+
+    def test_clones_independent(self):
+        form1 = self.F()
+        form2 = self.F()
+        form1.a.flags.hidden = True
+        form1.a.label.text = 'Changed'
+        form1.b.validators.append(required())
+        self.assertFalse(form2.a.flags.hidden)
+        self.assertEqual(form2.a.label.text, 'A')
+        self.assertEqual(form2.b.validators, [])
+
+    def test_invalidation(self):
+        class G(Form):
+            a = TextField()
+        G()
+        self.assertNotEqual(G._plan, None)
+        G.b = TextField()
+        self.assertEqual(G._plan, None)
+        self.assertEqual([f.name for f in G()], ['a', 'b'])
+        del G.a
+        self.assertEqual(G._plan, None)
+        self.assertEqual([f.name for f in G()], ['b'])
+
+    def test_per_instance_state(self):
+        class StatefulField(TextField):
+            def __init__(self, *args, **kwargs):
+                super(StatefulField, self).__init__(*args, **kwargs)
+                self.items = []
+
+        class G(Form):
+            a = StatefulField()
+            b = TextField()
+
+        self.assertFalse(StatefulField._is_cloneable())
+        self.assertTrue(TextField._is_cloneable())
+        form1, form2 = G(), G()
+        form1.a.items.append(1)
+        self.assertEqual(form2.a.items, [])
+        self.assertTrue(form1.a is not form2.a)
+        self.assertEqual(G._plan._prototypes[('', None)][1]['a'], None)
+
+    def test_dynamic_translations(self):
+        class SwitchingTranslations(object):
+            upper = False
+
+            def gettext(self, string):
+                return self.upper and string.upper() + '!' or string
+
+            def ngettext(self, singular, plural, n):
+                return n == 1 and singular or plural
+
+        translations = SwitchingTranslations()
+
+        class G(Form):
+            first_name = TextField()
+
+            def _get_translations(self):
+                return translations
+
+        self.assertEqual(G().first_name.label.text, 'First Name')
+        translations.upper = True
+        self.assertEqual(G().first_name.label.text, 'FIRST NAME!')
+        self.assertEqual(G._plan._prototypes, {})
+
+    def test_no_cache(self):
+        class G(Form):
+            CACHE_PLAN = False
+            a = TextField()
+        self.assertEqual(G().a.name, 'a')
+        self.assertEqual(G._plan._prototypes, {})
+
+
+class LazyFormTest(TestCase):
+    class F(Form):
+        LAZY = True
+        a = TextField()
+        b = IntegerField()
+        c = TextField()
+
+        def validate_c(form, field):
+            if field.data != 'foo':
+                raise ValidationError('error')
+
+    def test_attribute_access(self):
+        form = self.F(DummyPostData(a=['hello'], b=['2']))
+        self.assertEqual(form._fields, {})
+        self.assertEqual(form.b.data, 2)
+        self.assertEqual(list(form._fields), ['b'])
+        self.assertTrue(form.__dict__['b'] is form['b'])
+        self.assertTrue(isinstance(self.F.a, UnboundField))
+
+    def test_bind_all(self):
+        form = self.F(b=3)
+        self.assertEqual([x.name for x in form], ['a', 'b', 'c'])
+        self.assertEqual(self.F(b=3).data, {'a': None, 'b': 3, 'c': None})
+        form = self.F(c='bar')
+        self.assertEqual(form.validate(), False)
+        self.assertEqual(form.errors, {'c': ['error']})
+
+    def test_aliases(self):
+        class G(self.F):
+            pass
+        G.d = G.a
+        form = G()
+        self.assertEqual(sorted(form._fields), ['a', 'd'])
+        self.assertEqual(form.a.name, 'a')
+        self.assertEqual(form.d.name, 'd')
+
+    def test_delete(self):
+        form = self.F()
+        del form.a
+        self.assertEqual(form.a, None)
+        self.assertEqual([x.name for x in form], ['b', 'c'])
+
+
 class FormTest(TestCase):
     class F(Form):
         test = TextField()
@@ -131,6 +341,35 @@ class FormTest(TestCase):
         form = self.F()
         self.assertEqual(form.validate(), False)
 
+    def test_inline_validators(self):
+        class F(self.F):
+            other = TextField()
+
+        form = F(test='foobar', other='x')
+        self.assertEqual(F._inline_validators, {'test': (F.validate_test, )})
+        self.assertEqual(form.validate(), True)
+
+        def validate_other(form, field):
+            raise ValidationError('other')
+        F.validate_other = validate_other
+        self.assertEqual(F._inline_validators, None)
+        self.assertEqual(form.validate(), False)
+        self.assertEqual(form.errors, {'other': ['other']})
+        self.assertEqual(sorted(F(test='foobar')._inline_validators), ['other', 'test'])
+
+        del F.validate_other
+        self.assertEqual(F(test='foobar').validate(), True)
+        self.assertEqual(self.F._inline_validators is F._inline_validators, False)
+
+        class G(Form):
+            many = TextField()
+            other = TextField()
+
+            def validate_other(form, field):
+                pass
+        self.assertEqual(list(G()._inline_validators), ['other'])
+        self.assertEqual(G(many='x').validate(), True)
+
     def test_field_adding_disabled(self):
         form = self.F()
         self.assertRaises(TypeError, form.__setitem__, 'foo', TextField())
@@ -162,6 +401,38 @@ class FormTest(TestCase):
         MyForm.cherry = MyForm.kiwi
         self.assertEqual([x.name for x in MyForm()], ['cherry', 'kiwi', 'apple', 'strawberry'])
 
+    def test_validate_many(self):
+        class F(self.F):
+            num = IntegerField(validators=[required()])
+            tags = FieldList(TextField())
+
+        rows = [
+            DummyPostData(test=['foobar'], num=['1'], **{'tags-0': ['a'], 'tags-1': ['b']}),
+            {'test': 'bar', 'num': 2, 'tags-0': 'c'},
+            {'test': 'foobar', 'num': None},
+        ]
+        results = F.validate_many(rows)
+        self.assertEqual(len(results), 3)
+        self.assertEqual(results[0], ({'test': 'foobar', 'num': 1, 'tags': ['a', 'b']}, {}))
+        self.assertEqual(results[1], ({'test': 'bar', 'num': 2, 'tags': ['c']}, {'test': ['error']}))
+        data, errors = results[2]
+        self.assertEqual(data['tags'], [])
+        self.assertEqual(list(errors), ['num'])
+        self.assertEqual(F.validate_many([]), [])
+        self.assertEqual(F.validate_many([{}], prefix='p', num=3)[0][0]['num'], 3)
+
+    def test_validate_many_empty_rows(self):
+        class F(Form):
+            a = TextField(validators=[optional(), length(min=5)])
+
+        rows = [{'a': 'hello world'}, {}, {'a': 'hi'}, {}]
+        results = F.validate_many(rows)
+        self.assertEqual([list(errors) for data, errors in results], [[], [], ['a'], []])
+        for row, (data, errors) in zip(rows, results):
+            form = F(DictInputWrapper(row))
+            self.assertEqual(form.validate(), not errors)
+            self.assertEqual(form.data, data)
+
 
 if __name__ == '__main__':
     from unittest import main
@@ -0,0 +1,90 @@
+#!/usr/bin/env python
+from __future__ import unicode_literals
+
+from unittest import TestCase
+
+from wtforms import parallel
+from wtforms.compat import text_type
+from wtforms.fields import TextField, IntegerField
+from wtforms.form import Form
+from wtforms.parallel import validate_parallel
+from wtforms.validators import ValidationError, number_range, required
+
+
+class F(Form):
+    name = TextField(validators=[required()])
+    count = IntegerField(validators=[number_range(max=10)])
+
+    def validate_name(form, field):
+        if field.data == 'bad':
+            raise ValidationError('bad name')
+
+
+def make_rows(num_rows):
+    rows = []
+    for i in range(num_rows):
+        rows.append({'name': i % 3 and 'row %d' % i or (i % 2 and 'bad' or ''), 'count': i % 12})
+    return rows
+
+
+class ValidateParallelTest(TestCase):
+    def test_processes(self):
+        rows = make_rows(50)
+        expected = F.validate_many(rows)
+        self.assertEqual(validate_parallel(F, rows, chunk_size=7, max_workers=2), expected)
+        self.assertEqual(validate_parallel(F, iter(rows), chunk_size=100), expected)
+        self.assertEqual(validate_parallel(F, []), [])
+
+    def test_threads(self):
+        class G(F):
+            pass
+
+        self.assertEqual(parallel._get_import_path(G), None)
+        self.assertEqual(parallel._get_import_path(F), '%s:F' % __name__)
+        rows = make_rows(20)
+        self.assertEqual(validate_parallel(G, rows, chunk_size=3), G.validate_many(rows))
+        self.assertEqual(validate_parallel(F, rows, chunk_size=3, use_processes=False, count=1), F.validate_many(rows, count=1))
+
+    def test_unpicklable_rows(self):
+        class Name(text_type):
+            pass
+
+        # Only a row past the first chunk can't be pickled.
+        rows = make_rows(10) + [{'name': Name('local'), 'count': 1}]
+        tasks = list(parallel._iter_process_tasks(F, '%s:F' % __name__, [rows[:3], rows[9:]], '', {}))
+        self.assertEqual(tasks[0][0], parallel._validate_pickled_chunk)
+        self.assertEqual(tasks[1], (None, F.validate_many(rows[9:])))
+        self.assertEqual(validate_parallel(F, rows, chunk_size=3, max_workers=2), F.validate_many(rows))
+
+    def test_iter_results(self):
+        produced = []
+
+        def iter_tasks():
+            for i in range(20):
+                produced.append(i)
+                yield (lambda i: i * 2), (i, )
+            yield None, 'done'
+
+        class Executor(object):
+            def submit(self, func, *args):
+                return parallel._Done(func(*args))
+
+        results = []
+        for result in parallel._iter_results(Executor(), iter_tasks(), 3):
+            # Tasks are only read a few ahead of the results.
+            self.assertTrue(len(produced) - len(results) <= 4)
+            results.append(result)
+        self.assertEqual(results, [i * 2 for i in range(20)] + ['done'])
+
+    def test_no_futures(self):
+        futures = parallel.futures
+        parallel.futures = None
+        try:
+            rows = make_rows(10)
+            self.assertEqual(validate_parallel(F, rows, chunk_size=4), F.validate_many(rows))
+        finally:
+            parallel.futures = futures
+
+    def test_chunk_size(self):
+        self.assertRaises(ValueError, validate_parallel, F, [], chunk_size=0)
+        self.assertEqual(list(parallel._iter_chunks(range(5), 2)), [[0, 1], [2, 3], [4]])
@@ -4,6 +4,7 @@ from unittest import TestCase
 
 from wtforms import Form, TextField
 from wtforms import validators as v
+from wtforms.fields.core import CachedTranslations
 
 
 class Lower_Translator(object):
@@ -51,3 +52,64 @@ class TranslationsTest(TestCase):
         form = self.F(a='hellobye')
         self.assertFalse(form.validate())
         self.assertEqual(form.a.errors[0], 'field cannot be longer than 5 characters.')
+
+
+class CountingTranslator(Lower_Translator):
+    def __init__(self):
+        self.calls = 0
+
+    def gettext(self, s):
+        self.calls += 1
+        return super(CountingTranslator, self).gettext(s)
+
+    def ngettext(self, singular, plural, n):
+        self.calls += 1
+        return super(CountingTranslator, self).ngettext(singular, plural, n)
+
+
+class CachedTranslationsTest(TestCase):
+    translator = CountingTranslator()
+
+    class F(Form):
+        CACHE_TRANSLATIONS = True
+        a = TextField(validators=[v.Length(max=5)])
+
+        def _get_translations(self):
+            return CachedTranslationsTest.translator
+
+    def test_cache(self):
+        translator = CountingTranslator()
+        cached = CachedTranslations(translator, maxsize=3)
+        self.assertEqual(cached.gettext('Foo'), 'foo')
+        self.assertEqual(cached.gettext('Foo'), 'foo')
+        self.assertEqual(cached.ngettext('Bar', 'Bars', 2), 'bars')
+        self.assertEqual(cached.ngettext('Bar', 'Bars', 1), 'bar')
+        self.assertEqual(cached.ngettext('Bar', 'Bars', 1), 'bar')
+        self.assertEqual(translator.calls, 3)
+        self.assertEqual(cached.cache_info(), (2, 3, 3, 3))
+
+        # A full cache is emptied.
+        cached.gettext('Baz')
+        self.assertEqual(cached.cache_info().currsize, 1)
+
+        # Unhashable strings are translated every time.
+        self.assertRaises(AttributeError, cached.gettext, ['Foo'])
+
+        cached.cache_clear()
+        self.assertEqual(cached.cache_info(), (0, 0, 3, 0))
+
+    def test_form(self):
+        self.translator.calls = 0
+        forms = [self.F(a='hellobye') for i in range(3)]
+        for form in forms:
+            self.assertFalse(form.validate())
+            self.assertEqual(form.a.errors, ['field cannot be longer than 5 characters.'])
+            self.assertEqual(form.a.label.text, 'a')
+        self.assertTrue(forms[0].a._translations is forms[1].a._translations)
+        self.assertEqual(self.translator.calls, 2)
+        self.assertEqual(forms[1].a.gettext('A'), 'a')
+        self.assertEqual(self.translator.calls, 2)
+        self.assertEqual(forms[0].a._translations.cache_info().hits, 1)
+
+        # Translations aren't cached unless the form asks for it.
+        self.assertTrue(TranslationsTest.F().a._translations.__class__ is Lower_Translator)
@@ -0,0 +1,120 @@
+#!/usr/bin/env python
+from __future__ import unicode_literals
+
+import asyncio
+from unittest import TestCase
+
+from wtforms.fields import TextField, FieldList, FormField
+from wtforms.form import BaseForm, Form
+from wtforms.validators import ValidationError, StopValidation, required
+
+
+class DummyPostData(dict):
+    def getlist(self, key):
+        v = self[key]
+        if not isinstance(v, (list, tuple)):
+            v = [v]
+        return v
+
+
+def run(coroutine):
+    loop = asyncio.new_event_loop()
+    asyncio.set_event_loop(loop)
+    try:
+        return loop.run_until_complete(asyncio.wait_for(coroutine, 1))
+    finally:
+        asyncio.set_event_loop(None)
+        loop.close()
+
+
+def later(result=None, exception=None):
+    """ A validator returning a future which completes on the next loop iteration. """
+    def _validator(form, field):
+        future = asyncio.Future()
+        if exception is not None:
+            asyncio.get_event_loop().call_soon(future.set_exception, exception)
+        else:
+            asyncio.get_event_loop().call_soon(future.set_result, result)
+        return future
+    return _validator
+
+
+class FieldValidateAsyncTest(TestCase):
+    def test_errors(self):
+        calls = []
+        form = BaseForm([('a', TextField(validators=[
+            later(exception=ValidationError('first')),
+            lambda form, field: calls.append('sync'),
+            later(exception=StopValidation('stopped')),
+            lambda form, field: calls.append('not called'),
+        ])), ('b', TextField(validators=[required(), later()]))])
+        form.process(DummyPostData(a='x', b='y'))
+        self.assertEqual(run(form.validate_async()), False)
+        self.assertEqual(form.errors, {'a': ['first', 'stopped']})
+        self.assertEqual(calls, ['sync'])
+
+        form.process(DummyPostData(a='x'))
+        self.assertEqual(run(form['b'].validate_async(form)), False)
+        self.assertEqual(form['b'].errors, ['This field is required.'])
+
+    def test_concurrent(self):
+        started = []
+
+        def wait_for_both(form, field):
+            started.append(field.name)
+            if len(started) == 1:
+                wait_for_both.future = asyncio.Future()
+            else:
+                wait_for_both.future.set_result(None)
+            return wait_for_both.future
+
+        form = BaseForm([('a', TextField(validators=[wait_for_both])), ('b', TextField(validators=[wait_for_both]))])
+        form.process(None)
+        self.assertEqual(run(form.validate_async()), True)
+        self.assertEqual(sorted(started), ['a', 'b'])
+
+
+class FormValidateAsyncTest(TestCase):
+    class F(Form):
+        a = TextField()
+        items = FieldList(TextField(validators=[later(exception=ValueError('bad item'))]))
+
+        def validate_a(form, field):
+            return later(exception=ValidationError('inline'))(form, field)
+
+    def test_inline(self):
+        form = self.F(DummyPostData({'a': 'x', 'items-0': 'y', 'items-1': 'z'}))
+        self.assertEqual(run(form.validate_async()), False)
+        self.assertEqual(form.errors, {'a': ['inline'], 'items': [['bad item'], ['bad item']]})
+
+    def test_form_field(self):
+        class G(Form):
+            inner = FormField(self.F)
+        form = G(DummyPostData({'inner-a': 'x'}))
+        self.assertEqual(run(form.validate_async()), False)
+        self.assertEqual(form.errors, {'inner': {'a': ['inline']}})
+
+    def test_sync_override(self):
+        class G(self.F):
+            def validate(self):
+                return 'sync'
+        self.assertEqual(run(G().validate_async()), 'sync')
+
+    def test_sync_override_async_validator(self):
+        @asyncio.coroutine
+        def fail():
+            raise ValidationError('inline')
+            yield
+
+        class G(Form):
+            a = TextField()
+
+            def validate_a(form, field):
+                return fail()
+
+            def validate(self):
+                return super(G, self).validate()
+
+        form = G(DummyPostData(a='x'))
+        self.assertRaises(TypeError, run, form.validate_async())
+        self.assertRaises(TypeError, form.validate)
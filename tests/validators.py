@@ -1,10 +1,13 @@
 #!/usr/bin/env python
+import re
+import threading
 from unittest import TestCase
 from wtforms.compat import text_type
 from wtforms.validators import (
     StopValidation, ValidationError, email, equal_to,
     ip_address, length, required, optional, regexp,
-    url, NumberRange, AnyOf, NoneOf, mac_address, UUID
+    url, NumberRange, AnyOf, NoneOf, mac_address, UUID, regex_cache_info,
+    clear_regex_cache, _RegexCache
 )
 from functools import partial
 
@@ -213,6 +216,66 @@ class ValidatorsTest(TestCase):
         self.assertEqual(NoneOf(['a', 'b', 'c'])(self.form, DummyField('d')), None)
         self.assertRaises(ValueError, NoneOf(['a', 'b', 'c']), self.form, DummyField('a'))
 
+    def test_regex_cache(self):
+        clear_regex_cache()
+        self.assertEqual(regex_cache_info()[:2], (0, 0))
+        self.assertTrue(regexp('^a+$').regex is regexp('^a+$').regex)
+        self.assertTrue(regexp('^a+$', re.I).regex is not regexp('^a+$').regex)
+        self.assertTrue(email().regex is email().regex)
+        info = regex_cache_info()
+        self.assertEqual((info.hits, info.misses, info.currsize), (3, 3, 3))
+
+        cache = _RegexCache(2)
+        a = cache('a')
+        cache('b')
+        self.assertTrue(cache('a') is a)
+        cache('c')
+        self.assertTrue(cache('a') is a)
+        self.assertEqual(cache.cache_info(), (2, 3, 2, 2))
+        cache('b')
+        self.assertEqual(cache.cache_info().misses, 4)
+        cache.cache_clear()
+        self.assertEqual(cache.cache_info(), (0, 0, 2, 0))
+
+        # Hits racing with evictions leave no stale records of last use.
+        errors = []
+        def work():
+            try:
+                for i in range(2000):
+                    cache('abcde'[i % 5])
+            except Exception as e:
+                errors.append(e)
+        threads = [threading.Thread(target=work) for i in range(4)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+        self.assertEqual(errors, [])
+        self.assertEqual(set(cache._last_used), set(cache._patterns))
+
+    def test_is_valid(self):
+        self.assertTrue(length(min=2, max=3).is_valid('ab'))
+        self.assertFalse(length(min=2).is_valid(None))
+        self.assertTrue(NumberRange(min=1).is_valid(1))
+        self.assertFalse(NumberRange(max=1).is_valid(None))
+        self.assertTrue(email().is_valid('foo@bar.dk'))
+        self.assertFalse(url().is_valid(None))
+        self.assertTrue(UUID().is_valid('2bc1c94f-0deb-43e9-92a1-4775189ec9f8'))
+        self.assertFalse(mac_address().is_valid('00:00'))
+        self.assertTrue(ip_address().is_valid('10.0.0.255'))
+        self.assertFalse(ip_address().is_valid('10.0.0.256'))
+        self.assertFalse(ip_address().is_valid('10.0.0'))
+        self.assertFalse(ip_address().is_valid('::1'))
+        self.assertTrue(ip_address(ipv6=True).is_valid('::1'))
+        self.assertTrue(AnyOf(['a']).is_valid('a'))
+        self.assertFalse(NoneOf(['a']).is_valid('a'))
+
+        # The message is only looked up when validation fails.
+        validator = email()
+        self.assertEqual(validator(self.form, DummyField('foo@bar.dk')), None)
+        self.assertEqual(validator.message, None)
+        self.assertEqual(grab_error_message(validator, self.form, DummyField('foo')), 'Invalid email address.')
+
 if __name__ == '__main__':
     from unittest import main
     main()
@@ -29,6 +29,15 @@ class HTMLParamsTest(TestCase):
         self.assertEqual(html_params(class__='foo'), 'class_="foo"')
         self.assertEqual(html_params(for_='foo'), 'for="foo"')
 
+    def test_cache(self):
+        from wtforms.widgets import core
+        core._attribute_cache.clear()
+        expected = 'class="a&quot;b" id="f" multiple value="&lt;x&gt;"'
+        self.assertEqual(html_params(id='f', class_='a"b', value='<x>', multiple=True), expected)
+        self.assertEqual(sorted(core._attribute_cache.values()), ['class="a&quot;b"', 'id="f"'])
+        self.assertEqual(html_params(id='f', class_='a"b', value='<x>', multiple=True), expected)
+        self.assertEqual(html_params(size=10, id='f'), 'id="f" size="10"')
+
 
 class ListWidgetTest(TestCase):
     def test(self):
@@ -53,6 +62,35 @@ class TableWidgetTest(TestCase):
         field = DummyField(inner_fields, id='hai')
         self.assertEqual(TableWidget()(field), '<table id="hai"><tr><th>lfoo</th><td>hidden1foo</td></tr><tr><th>lbar</th><td>bar</td></tr></table>hidden2')
 
+    def test_cache_template(self):
+        from wtforms.form import Form
+        from wtforms.fields import TextField, HiddenField, TextAreaField, PasswordField, SelectField, BooleanField
+
+        class F(Form):
+            token = HiddenField()
+            name = TextField()
+            bio = TextAreaField()
+            password = PasswordField()
+            color = SelectField(choices=[('r', 'Red'), ('g', 'Green')])
+            agree = BooleanField()
+            after = HiddenField()
+
+        plain = TableWidget(with_table_tag=False)
+        cached = TableWidget(with_table_tag=False, cache_template=True)
+        for data in [{}, dict(token='a"b', name='<x>', bio='"&"', password='p', color='g', agree=True, after='z')]:
+            form = F(**data)
+            self.assertEqual(cached(form), plain(form))
+        self.assertEqual(len(cached._templates), 1)
+        self.assertEqual(cached(form, class_='t'), plain(form, class_='t'))
+        self.assertEqual(len(cached._templates), 2)
+
+        form.name.label.text = 'Your name'
+        self.assertTrue('<th><label for="name">Your name</label></th>' in cached(form))
+        self.assertEqual(len(cached._templates), 3)
+
+        form = F(prefix='p', name='<y>')
+        self.assertEqual(TableWidget(cache_template=True)(form, id='f'), TableWidget()(form, id='f'))
+
 
 class BasicWidgetsTest(TestCase):
     """Test most of the basic input widget types"""
@@ -104,6 +142,50 @@ class SelectTest(TestCase):
         self.assertEqual(Select(multiple=True)(self.field), 
             '<select id="" multiple name="f"><option selected value="foo">lfoo</option><option value="bar">lbar</option></select>')
 
+    def test_rendered_choices(self):
+        class Choices(tuple):
+            def rendered_options(self, render_option):
+                return (('<unselected>', '<selected>'), )
+
+        field = DummyField([('foo', 'lfoo', True), ('bar', 'lbar', False)])
+        # Pre-rendered options are used only for choices yielded unchanged.
+        field.choices = Choices([field.data[0][:2], ('bar', 'other')])
+        self.assertEqual(Select()(field),
+            '<select id="" name="f"><selected><option value="bar">lbar</option></select>')
+
+    def test_cache_options(self):
+        choices = [('foo', 'lfoo'), ('bar', 'l<bar>')]
+        field = DummyField([c + (c[0] == 'bar', ) for c in choices])
+        field.choices = choices
+        widget = Select(cache_options=True)
+        expected = '<select id="" name="f"><option value="foo">lfoo</option><option selected value="bar">l&lt;bar&gt;</option></select>'
+        self.assertEqual(widget(field), expected)
+        self.assertEqual(len(widget._rendered), 1)
+        self.assertEqual(widget(field), expected)
+
+        # Choices replaced or added in place are rendered correctly.
+        choices[0] = ('baz', 'lbaz')
+        choices.append(('qux', 'lqux'))
+        field.data = [c + (False, ) for c in choices]
+        self.assertEqual(widget(field), '<select id="" name="f"><option value="baz">lbaz</option><option value="bar">l&lt;bar&gt;</option><option value="qux">lqux</option></select>')
+
+
+class OptionTest(TestCase):
+    def test_cache_options(self):
+        class Label(object):
+            text = 'lfoo'
+        field = DummyField('foo')
+        field.label = Label()
+        field.checked = True
+        widget = Option(cache_options=True)
+        self.assertEqual(widget(field), '<option selected value="foo">lfoo</option>')
+        self.assertEqual(widget(field), '<option selected value="foo">lfoo</option>')
+        self.assertEqual(len(widget._rendered), 1)
+        self.assertEqual(widget(field, disabled=True), '<option disabled selected value="foo">lfoo</option>')
+        field.checked = False
+        self.assertEqual(widget(field), '<option value="foo">lfoo</option>')
+
+
 if __name__ == '__main__':
     from unittest import main
     main()
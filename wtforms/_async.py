@@ -0,0 +1,143 @@
+"""
+Coroutine implementations of the `validate_async` methods of forms and fields.
+
+These need Python 3.5 or newer, so they are kept apart from the classes which
+use them, which only do so on versions which can import this module.
+"""
+import asyncio
+import inspect
+
+from wtforms.compat import iteritems
+from wtforms.validators import StopValidation
+
+
+async def _call(func, *args):
+    """ Call `func`, awaiting the result if it is awaitable. """
+    result = func(*args)
+    if inspect.isawaitable(result):
+        result = await result
+    return result
+
+
+def _overrides_validate(obj):
+    """
+    Returns `True` if the class of `obj` overrides `validate` more recently
+    than `validate_async`, in which case the synchronous version must be used
+    to respect the override.
+    """
+    for cls in type(obj).__mro__:
+        if 'validate_async' in cls.__dict__:
+            return False
+        elif 'validate' in cls.__dict__:
+            return True
+    return False
+
+
+async def field_validate_async(self, form, extra_validators=tuple()):
+    """
+    Validates the field like `validate`, awaiting the result of any
+    validator, `pre_validate` or `post_validate` which returns an awaitable,
+    such as a coroutine. Errors are handled just as in `validate`.
+
+    :param form: The form the field belongs to.
+    :param extra_validators: A list of extra validators to run.
+    """
+    if _overrides_validate(self):
+        return await _call(self.validate, form, extra_validators)
+
+    self.errors = list(self.process_errors)
+    stop_validation = False
+
+    # Call pre_validate
+    try:
+        await _call(self.pre_validate, form)
+    except StopValidation as e:
+        if e.args and e.args[0]:
+            self.errors.append(e.args[0])
+        stop_validation = True
+    except ValueError as e:
+        self.errors.append(e.args[0])
+
+    # Run validators
+    if not stop_validation:
+        if extra_validators:
+            chain = tuple(self.validators) + tuple(extra_validators)
+        else:
+            chain = self.validators
+        for validator in chain:
+            try:
+                await _call(validator, form, self)
+            except StopValidation as e:
+                if e.args and e.args[0]:
+                    self.errors.append(e.args[0])
+                stop_validation = True
+                break
+            except ValueError as e:
+                self.errors.append(e.args[0])
+
+    # Call post_validate
+    try:
+        await _call(self.post_validate, form, stop_validation)
+    except ValueError as e:
+        self.errors.append(e.args[0])
+
+    return len(self.errors) == 0
+
+
+async def form_field_validate_async(self, form, extra_validators=tuple()):
+    if extra_validators:
+        raise TypeError('FormField does not accept in-line validators, as it gets errors from the enclosed form.')
+    return await self.form.validate_async()
+
+
+async def field_list_validate_async(self, form, extra_validators=tuple()):
+    self.errors = []
+    results = await asyncio.gather(*[subfield.validate_async(form) for subfield in self.entries])
+    for subfield, result in zip(self.entries, results):
+        if not result:
+            self.errors.append(subfield.errors)
+    return all(results)
+
+
+async def base_form_validate_async(self, extra_validators=None):
+    """
+    Validates the form like `validate`, running the validation of each field
+    concurrently with `asyncio.gather`. Validators of a single field are still
+    run in order, so `StopValidation` stops the chain as usual.
+
+    :param extra_validators:
+        If provided, is a dict mapping field names to a sequence of
+        callables which will be passed as extra validators to the field's
+        `validate_async` method.
+
+    Returns `True` if no errors occur.
+    """
+    if _overrides_validate(self):
+        return await _call(self.validate, extra_validators)
+
+    if self._pending:
+        self._bind_all()
+    self._errors = None
+    pending = []
+    for name, field in iteritems(self._fields):
+        if extra_validators is not None and name in extra_validators:
+            extra = extra_validators[name]
+        else:
+            extra = tuple()
+        pending.append(field.validate_async(self, extra))
+    results = await asyncio.gather(*pending)
+    return all(results)
+
+
+async def form_validate_async(self):
+    """
+    Validates the form like `validate`, running the validation of each field
+    concurrently. In-line `validate_<fieldname>` validators may be coroutine
+    functions.
+    """
+    if _overrides_validate(self):
+        return await _call(self.validate)
+
+    if self._pending:
+        self._bind_all()
+    return await base_form_validate_async(self, self._get_inline_validators())
@@ -0,0 +1,296 @@
+"""
+Columnar validation of bulk data.
+
+Rather than validating a form once per row, `validate_columns` takes a column
+of values for each field and runs each of the field's validators over the
+whole column at once. This avoids the cost of the validation chain in
+`Field.validate` for every row, which dominates when importing large amounts
+of data.
+"""
+from __future__ import unicode_literals
+
+from wtforms.compat import string_types, iteritems
+from wtforms.fields.core import Field
+from wtforms.validators import (
+    AnyOf, DataRequired, Length, NoneOf, NumberRange, Optional, Regexp,
+    StopValidation
+)
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+__all__ = ('validate_columns', )
+
+
+def validate_columns(form_class, columns, prefix=''):
+    """
+    Validate columns of data with the fields of `form_class`.
+
+    The `Length`, `NumberRange`, `Regexp`, `AnyOf`, `NoneOf`, `DataRequired`
+    and `Optional` validators (and their aliases) are run over whole columns.
+    Fields which use any other validators, an in-line `validate_<fieldname>`
+    validator or which customize `pre_validate` or `post_validate` are
+    validated one row at a time instead, with the data of every field set to
+    that of the row, so that validators such as `EqualTo` work as usual.
+    Enclosures such as `FormField` and `FieldList` are not supported.
+
+    :param form_class:
+        The `Form` subclass whose fields validate the data.
+    :param columns:
+        A dict mapping field names to sequences of values, one per row. Values
+        are used as the data of the field, with `None` meaning that no input
+        was provided. Sequences may be lists, tuples or, if NumPy is
+        installed, NumPy arrays, in which case numeric and string columns are
+        checked with array operations. Fields without a column get `None` for
+        every row.
+    :param prefix:
+        The prefix to use for the form, as with the form's constructor.
+
+    Returns a dict mapping the index of each row which failed validation to a
+    dict of that row's errors, in the same form as `Form.errors`. Rows which
+    validated are not included.
+    """
+    num_rows = None
+    for name, column in iteritems(columns):
+        if num_rows is None:
+            num_rows = len(column)
+        elif len(column) != num_rows:
+            raise ValueError('All columns must have the same length; %r has %d values, not %d.' % (name, len(column), num_rows))
+    if num_rows is None:
+        num_rows = 0
+
+    form = form_class(prefix=prefix)
+    if form._pending:
+        form._bind_all()
+
+    results = {}
+    fallback = []
+    inline_validators = form._get_inline_validators()
+    for name, field in iteritems(form._fields):
+        if _defined_by(type(field), 'validate') is not Field:
+            raise TypeError('%s %r cannot be validated by columns.' % (type(field).__name__, name))
+
+        column = columns.get(name)
+        if column is None:
+            column = [None] * num_rows
+
+        extra = inline_validators.get(name, tuple())
+        checks = _get_column_checks(field)
+        if extra or checks is None:
+            fallback.append((name, field, extra))
+            continue
+
+        for index, errors in iteritems(_validate_column(form, field, checks, column, num_rows)):
+            results.setdefault(index, {})[name] = errors
+
+    if fallback:
+        data_columns = []
+        for name, field in iteritems(form._fields):
+            column = columns.get(name)
+            if column is None:
+                column = [None] * num_rows
+            elif numpy is not None and isinstance(column, numpy.ndarray):
+                column = column.tolist()
+            data_columns.append((field, column))
+
+        for index in range(num_rows):
+            for field, column in data_columns:
+                _set_data(field, column[index])
+            for name, field, extra in fallback:
+                if not field.validate(form, extra):
+                    results.setdefault(index, {})[name] = field.errors
+
+    return results
+
+
+def _get_column_checks(field):
+    """
+    Return a list of `(validator, check, stops)` tuples for the validators of
+    `field`, or `None` if the field can't be validated by columns.
+    """
+    field_class = type(field)
+    for method in ('pre_validate', 'post_validate'):
+        if _defined_by(field_class, method) is not Field:
+            return None
+
+    checks = []
+    for validator in field.validators:
+        entry = _COLUMN_CHECKS.get(_defined_by(type(validator), '__call__'))
+        if entry is None:
+            return None
+        checks.append((validator, ) + entry)
+    return checks
+
+
+def _defined_by(cls, name):
+    """ Return the class in the MRO of `cls` which defines `name`. """
+    for klass in cls.__mro__:
+        if name in klass.__dict__:
+            return klass
+    return None
+
+
+def _validate_column(form, field, checks, column, num_rows):
+    """
+    Run `checks` over `column`, returning a dict mapping row indices to lists
+    of errors for the rows which failed.
+    """
+    errors = {}
+    active = list(range(num_rows))
+    for validator, check, stops in checks:
+        if not active:
+            break
+        failed = check(validator, column, active)
+        if not failed:
+            continue
+
+        message = _get_message(form, field, validator, column[failed[0]])
+        if stops:
+            # Like the validators themselves, clear any prior errors and stop
+            # the chain for the failing rows.
+            for index in failed:
+                errors.pop(index, None)
+                if message:
+                    errors[index] = [message]
+            failed = set(failed)
+            active = [index for index in active if index not in failed]
+        else:
+            for index in failed:
+                errors.setdefault(index, []).append(message)
+    return errors
+
+
+def _get_message(form, field, validator, value):
+    """
+    Return the error message `validator` produces for `value`, which is known
+    to fail. Messages of the supported validators don't depend on the value,
+    so this is only done once per validator.
+    """
+    _set_data(field, value)
+    field.errors = []
+    try:
+        validator(form, field)
+    except StopValidation as e:
+        return e.args and e.args[0] or None
+    except ValueError as e:
+        return e.args[0]
+
+
+def _set_data(field, value):
+    field.data = value
+    field.raw_data = value is not None and [value] or []
+
+
+def _array_rows(column, rows):
+    """
+    If `column` is a NumPy array, return its values for `rows` as an array,
+    otherwise `None`.
+    """
+    if numpy is not None and isinstance(column, numpy.ndarray):
+        return column[numpy.asarray(rows, dtype=numpy.intp)]
+    return None
+
+
+def _from_mask(rows, mask):
+    return [row for row, failed in zip(rows, mask.tolist()) if failed]
+
+
+def _check_optional(validator, column, rows):
+    values = _array_rows(column, rows)
+    if values is not None:
+        if values.dtype.kind in 'biuf':
+            return []
+        elif values.dtype.kind in 'SU':
+            return _from_mask(rows, numpy.char.str_len(numpy.char.strip(values)) == 0)
+
+    failed = []
+    for row in rows:
+        value = column[row]
+        if value is None or isinstance(value, string_types) and not value.strip():
+            failed.append(row)
+    return failed
+
+
+def _check_data_required(validator, column, rows):
+    values = _array_rows(column, rows)
+    if values is not None:
+        if values.dtype.kind in 'biuf':
+            return _from_mask(rows, values == 0)
+        elif values.dtype.kind in 'SU':
+            return _from_mask(rows, numpy.char.str_len(numpy.char.strip(values)) == 0)
+
+    failed = []
+    for row in rows:
+        value = column[row]
+        if not value or isinstance(value, string_types) and not value.strip():
+            failed.append(row)
+    return failed
+
+
+def _check_length(validator, column, rows):
+    min, max = validator.min, validator.max
+    values = _array_rows(column, rows)
+    if values is not None and values.dtype.kind in 'SU':
+        lengths = numpy.char.str_len(values)
+        mask = lengths < min
+        if max != -1:
+            mask |= lengths > max
+        return _from_mask(rows, mask)
+
+    failed = []
+    for row in rows:
+        value = column[row]
+        l = value and len(value) or 0
+        if l < min or max != -1 and l > max:
+            failed.append(row)
+    return failed
+
+
+def _check_number_range(validator, column, rows):
+    min, max = validator.min, validator.max
+    values = _array_rows(column, rows)
+    if values is not None and values.dtype.kind in 'iuf':
+        mask = numpy.zeros(len(rows), dtype=bool)
+        if min is not None:
+            mask |= values < min
+        if max is not None:
+            mask |= values > max
+        return _from_mask(rows, mask)
+
+    failed = []
+    for row in rows:
+        value = column[row]
+        if value is None or (min is not None and value < min) or (max is not None and value > max):
+            failed.append(row)
+    return failed
+
+
+def _check_regexp(validator, column, rows):
+    match = validator.regex.match
+    return [row for row in rows if not match(column[row] or '')]
+
+
+def _check_any_of(validator, column, rows):
+    values = validator.values
+    return [row for row in rows if column[row] not in values]
+
+
+def _check_none_of(validator, column, rows):
+    values = validator.values
+    return [row for row in rows if column[row] in values]
+
+
+#: Maps each supported validator class to a `(check, stops)` tuple, where
+#: `check(validator, column, rows)` returns the rows which fail and `stops` is
+#: `True` if failing stops the validation chain.
+_COLUMN_CHECKS = {
+    Optional: (_check_optional, True),
+    DataRequired: (_check_data_required, True),
+    Length: (_check_length, False),
+    NumberRange: (_check_number_range, False),
+    Regexp: (_check_regexp, False),
+    AnyOf: (_check_any_of, False),
+    NoneOf: (_check_none_of, False),
+}
@@ -17,3 +17,18 @@ else:
 def with_metaclass(meta, base=object):
     return meta("NewBase", (base,), {})
 
+
+try:
+    from hmac import compare_digest
+except ImportError:
+    def compare_digest(a, b):
+        """
+        Compare two strings in time independent of where they differ, as
+        `hmac.compare_digest` (Python 2.7.7 and newer) does.
+        """
+        if len(a) != len(b):
+            return False
+        result = 0
+        for x, y in izip(a, b):
+            result |= ord(x) ^ ord(y)
+        return result == 0
@@ -1,10 +1,20 @@
 from __future__ import unicode_literals
 
+import hmac
+
+from hashlib import sha1
+
+from wtforms.compat import compare_digest
 from wtforms.form import Form
 from wtforms.validators import ValidationError
 
 from .fields import CSRFTokenField
 
+#: The maximum number of secret keys whose prepared hmac state is kept.
+HMAC_CACHE_SIZE = 64
+
+_hmac_templates = {}
+
 
 class SecureForm(Form):
     """
@@ -51,3 +61,27 @@ class SecureForm(Form):
         d = super(SecureForm, self).data
         d.pop('csrf_token')
         return d
+
+
+def _hmac_digest(key, *parts):
+    """
+    Return the hex hmac-sha1 digest of the concatenation of `parts` with
+    `key`. The hmac state after hashing the key is kept for each key, and
+    copied rather than recomputed.
+    """
+    template = _hmac_templates.get(key)
+    if template is None:
+        if len(_hmac_templates) >= HMAC_CACHE_SIZE:
+            _hmac_templates.clear()
+        template = _hmac_templates[key] = hmac.new(key, digestmod=sha1)
+    digest = template.copy()
+    for part in parts:
+        digest.update(part.encode('utf8'))
+    return digest.hexdigest()
+
+
+def _digest_matches(digest, submitted):
+    """
+    Compare `digest` with the `submitted` one in constant time.
+    """
+    return compare_digest(digest.encode('ascii'), submitted.encode('utf8'))
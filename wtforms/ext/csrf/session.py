@@ -14,20 +14,28 @@ expiration time is not passed, the CSRF validation will pass.
 """
 from __future__ import unicode_literals
 
-import hmac
 import os
 
 from hashlib import sha1
 from datetime import datetime, timedelta
+from time import time
 
 from ...validators import ValidationError
-from .form import SecureForm
+from .form import SecureForm, _digest_matches, _hmac_digest
+
+__all__ = ('SessionSecureForm', 'clear_token_cache')
+
+#: The maximum number of tokens kept by the token cache.
+TOKEN_CACHE_SIZE = 1024
+
+_token_cache = {}
 
-__all__ = ('SessionSecureForm', )
 
 class SessionSecureForm(SecureForm):
     TIME_FORMAT = '%Y%m%d%H%M%S'
     TIME_LIMIT = timedelta(minutes=30)
+    TIME_GRANULARITY = timedelta(seconds=1)
+    COMPACT_TOKENS = False
     SECRET_KEY = None
 
     def generate_csrf_token(self, csrf_context):
@@ -41,30 +49,59 @@ class SessionSecureForm(SecureForm):
         if 'csrf' not in session:
             session['csrf'] = sha1(os.urandom(64)).hexdigest()
 
-        self.csrf_token.csrf_key = session['csrf']
+        csrf_key = self.csrf_token.csrf_key = session['csrf']
         if self.TIME_LIMIT:
-            expires = (datetime.now() + self.TIME_LIMIT).strftime(self.TIME_FORMAT)
-            csrf_build = '%s%s' % (session['csrf'], expires)
+            # Round the expiry up to the granularity, so all tokens generated
+            # within the same period are equal and can be cached.
+            granularity = max(self.TIME_GRANULARITY.total_seconds(), 1)
+            expiry = int((time() // granularity + 1) * granularity + self.TIME_LIMIT.total_seconds())
         else:
-            expires = ''
-            csrf_build = session['csrf']
-
-        hmac_csrf = hmac.new(self.SECRET_KEY, csrf_build.encode('utf8'), digestmod=sha1) 
-        return '%s##%s' % (expires, hmac_csrf.hexdigest())
+            expiry = None
+        time_format = not self.COMPACT_TOKENS and self.TIME_FORMAT or None
+
+        key = (self.SECRET_KEY, csrf_key, time_format, expiry)
+        token = _token_cache.get(key)
+        if token is None:
+            if expiry is None:
+                expires = ''
+            elif time_format is None:
+                expires = '%d' % expiry
+            else:
+                expires = datetime.fromtimestamp(expiry).strftime(time_format)
+            token = '%s##%s' % (expires, _hmac_digest(self.SECRET_KEY, csrf_key, expires))
+
+            if len(_token_cache) >= TOKEN_CACHE_SIZE:
+                _token_cache.clear()
+            _token_cache[key] = token
+        return token
 
     def validate_csrf_token(self, field):
         if not field.data or '##' not in field.data:
             raise ValidationError(field.gettext('CSRF token missing'))
 
-        expires, hmac_csrf = field.data.split('##')
-
-        check_val = (field.csrf_key + expires).encode('utf8')
+        expires, _, hmac_csrf = field.data.partition('##')
 
-        hmac_compare = hmac.new(self.SECRET_KEY, check_val, digestmod=sha1)
-        if hmac_compare.hexdigest() != hmac_csrf:
+        if not _digest_matches(_hmac_digest(self.SECRET_KEY, field.csrf_key, expires), hmac_csrf):
             raise ValidationError(field.gettext('CSRF failed'))
 
         if self.TIME_LIMIT:
-            now_formatted = datetime.now().strftime(self.TIME_FORMAT)
-            if now_formatted > expires:
-                raise ValidationError(field.gettext('CSRF token expired'))
+            if self.COMPACT_TOKENS:
+                # Tokens in the other format, or from before TIME_LIMIT was
+                # shortened, may expire later than any token generated now.
+                now = time()
+                latest = now + self.TIME_LIMIT.total_seconds() + max(self.TIME_GRANULARITY.total_seconds(), 1)
+                if not expires.isdigit() or int(expires) > latest:
+                    raise ValidationError(field.gettext('CSRF failed'))
+                if int(expires) < now:
+                    raise ValidationError(field.gettext('CSRF token expired'))
+            else:
+                now_formatted = datetime.now().strftime(self.TIME_FORMAT)
+                if now_formatted > expires:
+                    raise ValidationError(field.gettext('CSRF token expired'))
+
+
+def clear_token_cache():
+    """
+    Remove all tokens cached by `SessionSecureForm.generate_csrf_token`.
+    """
+    _token_cache.clear()
@@ -0,0 +1,58 @@
+"""
+A provided CSRF implementation which needs no server-side storage.
+
+The token is the time it was generated and an hmac-sha1 of that time and an
+identifier of the client, such as the ID of a logged in user or the value of
+a cookie. Any server which knows the secret key can validate the token, so
+no session needs to be shared between servers or written to for visitors
+who only view a form.
+
+Several secret keys may be given to rotate keys: tokens are signed with the
+first key, and tokens signed with any of the keys validate.
+"""
+from __future__ import unicode_literals
+
+from datetime import timedelta
+from time import time
+
+from wtforms.compat import text_type
+
+from ...validators import ValidationError
+from .form import SecureForm, _digest_matches, _hmac_digest
+
+__all__ = ('SignedSecureForm', )
+
+
+class SignedSecureForm(SecureForm):
+    TIME_LIMIT = timedelta(minutes=30)
+    SECRET_KEYS = None
+
+    def generate_csrf_token(self, csrf_context):
+        if not self.SECRET_KEYS:
+            raise Exception('must set SECRET_KEYS in a subclass of this form for it to work')
+        if csrf_context is None:
+            raise TypeError('Must provide a client identifier as csrf context')
+
+        self.csrf_token.csrf_key = csrf_context
+        timestamp = '%d' % time()
+        return '%s##%s' % (timestamp, _hmac_digest(self.SECRET_KEYS[0], timestamp, ':', text_type(csrf_context)))
+
+    def validate_csrf_token(self, field):
+        if not field.data or '##' not in field.data:
+            raise ValidationError(field.gettext('CSRF token missing'))
+
+        timestamp, _, hmac_csrf = field.data.partition('##')
+        if not timestamp.isdigit():
+            raise ValidationError(field.gettext('CSRF failed'))
+
+        # The timestamp only contains digits, so it can't run into the
+        # identifier.
+        client_id = text_type(field.csrf_key)
+        for key in self.SECRET_KEYS:
+            if _digest_matches(_hmac_digest(key, timestamp, ':', client_id), hmac_csrf):
+                break
+        else:
+            raise ValidationError(field.gettext('CSRF failed'))
+
+        if self.TIME_LIMIT and int(timestamp) + self.TIME_LIMIT.total_seconds() < time():
+            raise ValidationError(field.gettext('CSRF token expired'))
@@ -19,5 +19,9 @@ class Form(form.Form):
     """
     _django_translations = DjangoTranslations()
 
+    # Django resolves the active language on every call, so labels can't be
+    # cached in prototype fields.
+    CACHE_PLAN = False
+
     def _get_translations(self):
         return self._django_translations
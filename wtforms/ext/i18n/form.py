@@ -17,10 +17,13 @@ class Form(form.Form):
         LANGUAGES = ['en_GB', 'en']
 
     Translations objects are cached to prevent having to get a new one for the
-    same languages every instantiation. 
+    same languages every instantiation, and the messages they return are
+    cached for each set of languages.
     """
     LANGUAGES = None
 
+    CACHE_TRANSLATIONS = True
+
     def _get_translations(self):
         languages = tuple(self.LANGUAGES) if self.LANGUAGES else None
         if languages not in translations_cache:
@@ -1,5 +1,12 @@
+import copy
+import gettext
 import os
 
+#: Maps each language with a catalog in the messages directory to its loaded
+#: GNUTranslations object, once `preload_translations` has been called.
+_preloaded = None
+
+
 def messages_path():
     """
     Determine the path to the 'messages' directory as best possible.
@@ -13,14 +20,81 @@ def get_builtin_gnu_translations(languages=None):
     Get a gettext.GNUTranslations object pointing at the
     included translation files.
 
+    If `preload_translations` has been called, the catalogs for the given
+    languages are taken from memory rather than searched for and read from
+    the messages directory.
+
     :param languages:
         A list of languages to try, in order. If omitted or None, then
         gettext will try to use locale information from the environment.
     """
-    import gettext
+    if _preloaded is not None and languages:
+        translations = _get_preloaded_translations(languages)
+        if translations is not None:
+            return translations
     return gettext.translation('wtforms', messages_path(), languages)
 
 
+def preload_translations():
+    """
+    Load every catalog included in the messages directory into memory, so
+    that `get_translations` doesn't need to find and parse the catalog files
+    the first time each language is used.
+
+    Call this once at startup, before forking any worker processes, so the
+    catalogs are shared by all of them. The loaded catalogs are never
+    modified. Languages taken from the environment, and lists of languages
+    none of which has an included catalog, are still looked up by gettext.
+
+    Returns a sorted list of the languages loaded.
+    """
+    global _preloaded
+    path = messages_path()
+    catalogs = {}
+    for language in os.listdir(path):
+        filename = os.path.join(path, language, 'LC_MESSAGES', 'wtforms.mo')
+        if os.path.isfile(filename):
+            with open(filename, 'rb') as fp:
+                catalogs[language] = gettext.GNUTranslations(fp)
+    _preloaded = catalogs
+    return sorted(catalogs)
+
+
+def _get_preloaded_translations(languages):
+    """
+    Return the preloaded catalogs for `languages` chained like
+    `gettext.translation` does, or `None` if none of the languages has a
+    preloaded catalog.
+    """
+    found = []
+    for language in languages:
+        for candidate in _expand_language(language):
+            translations = _preloaded.get(candidate)
+            if translations is not None and translations not in found:
+                found.append(translations)
+    if not found:
+        return None
+
+    # Copies are chained so the preloaded catalogs are never modified.
+    result = copy.copy(found[0])
+    for translations in found[1:]:
+        result.add_fallback(copy.copy(translations))
+    return result
+
+
+def _expand_language(language):
+    """
+    Return the names to look for a catalog of `language` under, most specific
+    first, such as ``['en_US.UTF-8', 'en_US', 'en']`` for ``'en_US.UTF-8'``.
+    """
+    names = [language]
+    base = language.split('@')[0].split('.')[0]
+    for name in (base, base.split('_')[0]):
+        if name not in names:
+            names.append(name)
+    return names
+
+
 def get_translations(languages=None):
     """
     Get a WTForms translation object which wraps the builtin GNUTranslations object.
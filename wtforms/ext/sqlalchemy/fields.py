@@ -3,10 +3,12 @@ Useful form fields for use with SQLAlchemy ORM.
 """
 from __future__ import unicode_literals
 
+import numbers
 import operator
+from collections import OrderedDict
 
 from wtforms import widgets
-from wtforms.compat import text_type, string_types
+from wtforms.compat import text_type, string_types, iteritems
 from wtforms.fields import SelectFieldBase
 from wtforms.validators import ValidationError
 
@@ -16,6 +18,11 @@ try:
 except ImportError:
     has_identity_key = False
 
+try:
+    from sqlalchemy.orm import class_mapper
+except ImportError:
+    class_mapper = None
+
 
 
 __all__ = (
@@ -52,12 +59,19 @@ class QuerySelectField(SelectFieldBase):
     top of the list. Selecting this choice will result in the `data` property
     being `None`. The label for this blank choice can be set by specifying the
     `blank_text` parameter.
+
+    By default the whole query is loaded into a list the first time it is
+    needed. If `fetch_submitted` is `True`, submitted choices are instead
+    looked up with a single `IN` query for their primary keys, and the query
+    is iterated afresh when rendering, without keeping the results. This only
+    applies to queries on a single model with a single primary key column,
+    using the default `get_pk`; otherwise the whole query is loaded as usual.
     """
     widget = widgets.Select()
 
     def __init__(self, label=None, validators=None, query_factory=None,
                  get_pk=None, get_label=None, allow_blank=False,
-                 blank_text='', **kwargs):
+                 blank_text='', fetch_submitted=False, **kwargs):
         super(QuerySelectField, self).__init__(label, validators, **kwargs)
         self.query_factory = query_factory
 
@@ -77,15 +91,18 @@ class QuerySelectField(SelectFieldBase):
 
         self.allow_blank = allow_blank
         self.blank_text = blank_text
+        self.fetch_submitted = fetch_submitted
         self.query = None
         self._object_list = None
+        self._object_index = None
+        self._indexed_list = None
+        self._fetch_state = None
 
     def _get_data(self):
         if self._formdata is not None:
-            for pk, obj in self._get_object_list():
-                if pk == self._formdata:
-                    self._set_data(obj)
-                    break
+            found = self._get_objects_by_pk([self._formdata])
+            if found:
+                self._set_data(found[0][1])
         return self._data
 
     def _set_data(self, data):
@@ -101,12 +118,106 @@ class QuerySelectField(SelectFieldBase):
             self._object_list = list((text_type(get_pk(obj)), obj) for obj in query)
         return self._object_list
 
+    def _get_object_index(self):
+        """
+        Return a dict mapping the primary keys of `_get_object_list()` to
+        `(position, pk, obj)` tuples, keeping the first object for any
+        duplicate key.
+        """
+        object_list = self._get_object_list()
+        if self._indexed_list is not object_list:
+            index = {}
+            for position, (pk, obj) in enumerate(object_list):
+                index.setdefault(pk, (position, pk, obj))
+            self._object_index = index
+            self._indexed_list = object_list
+        return self._object_index
+
+    def _get_objects_by_pk(self, pks):
+        """
+        Return a list of `(pk, obj)` pairs for those of `pks` which are in the
+        query, in the order of the query. When fetching by primary key, keys
+        which have all been fetched before aren't fetched again.
+        """
+        pks = set(pks)
+        pk_column = self._get_fetch_column()
+        if pk_column is None:
+            index = self._get_object_index()
+            found = sorted(index[pk] for pk in pks if pk in index)
+            return [(pk, obj) for position, pk, obj in found]
+
+        source, query, pk_column, fetched = self._fetch_state
+        if all(pk in fetched for pk in pks):
+            return [(pk, obj) for pk, obj in iteritems(fetched) if pk in pks]
+
+        found = []
+        seen = set()
+        values = _coerce_pks(pk_column, pks)
+        if values:
+            for obj in query.filter(pk_column.in_(values)):
+                pk = text_type(self.get_pk(obj))
+                # Only keys submitted exactly as they are rendered are
+                # choices, even if others convert to the same value.
+                if pk in pks and pk not in seen:
+                    seen.add(pk)
+                    fetched[pk] = obj
+                    found.append((pk, obj))
+        return found
+
+    def _get_fetch_column(self):
+        """
+        If submitted choices should be fetched by primary key, return the
+        primary key column to filter the query by, otherwise `None`.
+
+        The column is looked up once for each query. Objects fetched by
+        primary key are kept with it, so they aren't fetched again to be
+        validated.
+        """
+        if not self.fetch_submitted or self.get_pk is not get_pk_from_identity or class_mapper is None:
+            return None
+        state = self._fetch_state
+        if state is None or state[0] is not self.query:
+            state = self._fetch_state = (self.query, ) + _get_fetch_state(self.query or self.query_factory())
+        return state[2]
+
+    def _iter_objects(self):
+        """
+        Yield `(pk, obj)` pairs for the query, straight from the query if
+        submitted choices are fetched by primary key.
+        """
+        if self._get_fetch_column() is None:
+            for pair in self._get_object_list():
+                yield pair
+        else:
+            get_pk = self.get_pk
+            for obj in self._fetch_state[1]:
+                yield text_type(get_pk(obj)), obj
+
+    def _are_choices(self, objs):
+        """ Returns `True` if all of `objs` are objects of the query. """
+        keyed = []
+        for obj in objs:
+            try:
+                keyed.append((text_type(self.get_pk(obj)), obj))
+            except Exception:
+                # Not something we can get a key for, so compare it with
+                # every object instead.
+                if not any(obj == candidate for pk, candidate in self._iter_objects()):
+                    return False
+
+        found = dict(self._get_objects_by_pk(pk for pk, obj in keyed))
+        for pk, obj in keyed:
+            if not (pk in found and found[pk] == obj):
+                return False
+        return True
+
     def iter_choices(self):
         if self.allow_blank:
             yield ('__None', self.blank_text, self.data is None)
 
-        for pk, obj in self._get_object_list():
-            yield (pk, self.get_label(obj), obj == self.data)
+        data = self.data
+        for pk, obj in self._iter_objects():
+            yield (pk, self.get_label(obj), obj == data)
 
     def process_formdata(self, valuelist):
         if valuelist:
@@ -117,11 +228,9 @@ class QuerySelectField(SelectFieldBase):
                 self._formdata = valuelist[0]
 
     def pre_validate(self, form):
-        if not self.allow_blank or self.data is not None:
-            for pk, obj in self._get_object_list():
-                if self.data == obj:
-                    break
-            else:
+        data = self.data
+        if not self.allow_blank or data is not None:
+            if data is None or not self._are_choices([data]):
                 raise ValidationError(self.gettext('Not a valid choice'))
 
 
@@ -145,16 +254,10 @@ class QuerySelectMultipleField(QuerySelectField):
     def _get_data(self):
         formdata = self._formdata
         if formdata is not None:
-            data = []
-            for pk, obj in self._get_object_list():
-                if not formdata:
-                    break
-                elif pk in formdata:
-                    formdata.remove(pk)
-                    data.append(obj)
-            if formdata:
+            found = self._get_objects_by_pk(formdata)
+            if len(found) < len(formdata):
                 self._invalid_formdata = True
-            self._set_data(data)
+            self._set_data([obj for pk, obj in found])
         return self._data
 
     def _set_data(self, data):
@@ -164,8 +267,9 @@ class QuerySelectMultipleField(QuerySelectField):
     data = property(_get_data, _set_data)
 
     def iter_choices(self):
-        for pk, obj in self._get_object_list():
-            yield (pk, self.get_label(obj), obj in self.data)
+        data = self.data
+        for pk, obj in self._iter_objects():
+            yield (pk, self.get_label(obj), obj in data)
 
     def process_formdata(self, valuelist):
         self._formdata = set(valuelist)
@@ -173,11 +277,48 @@ class QuerySelectMultipleField(QuerySelectField):
     def pre_validate(self, form):
         if self._invalid_formdata:
             raise ValidationError(self.gettext('Not a valid choice'))
-        elif self.data:
-            obj_list = list(x[1] for x in self._get_object_list())
-            for v in self.data:
-                if v not in obj_list:
-                    raise ValidationError(self.gettext('Not a valid choice'))
+        elif self.data and not self._are_choices(self.data):
+            raise ValidationError(self.gettext('Not a valid choice'))
+
+
+def _get_fetch_state(query):
+    """
+    Return a `(query, pk_column, fetched)` tuple for fetching the objects of
+    `query` by primary key, where `fetched` is an empty ordered dict for the
+    objects found, and `pk_column` is `None` if they can't be fetched that way.
+    """
+    try:
+        descriptions = query.column_descriptions
+        if len(descriptions) != 1:
+            return query, None, None
+        primary_key = class_mapper(descriptions[0]['type']).primary_key
+    except Exception:
+        return query, None, None
+    if len(primary_key) != 1 or not hasattr(query, 'filter'):
+        return query, None, None
+    return query, primary_key[0], OrderedDict()
+
+
+def _coerce_pks(column, pks):
+    """
+    Return `pks` converted to the Python type of the numeric `column`, so
+    that a typed database isn't sent strings to compare with numbers. Keys
+    which can't be converted are left out, as they can't be choices.
+    """
+    try:
+        python_type = column.type.python_type
+    except (AttributeError, NotImplementedError):
+        return list(pks)
+    if not issubclass(python_type, numbers.Number):
+        return list(pks)
+
+    values = []
+    for pk in pks:
+        try:
+            values.append(python_type(pk))
+        except (ValueError, TypeError, ArithmeticError):
+            pass
+    return values
 
 
 def get_pk_from_identity(obj):
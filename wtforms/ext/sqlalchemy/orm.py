@@ -4,18 +4,33 @@ Tools for generating forms based on SQLAlchemy models.
 from __future__ import unicode_literals
 
 import inspect
+from collections import namedtuple
+
+try:
+    from sqlalchemy.orm.scoping import ScopedSession
+except ImportError:
+    from sqlalchemy.orm.scoping import scoped_session as ScopedSession
 
 from wtforms import fields as f
 from wtforms import validators
+from wtforms.compat import iteritems
 from wtforms.form import Form
 from wtforms.ext.sqlalchemy.fields import QuerySelectField
 from wtforms.ext.sqlalchemy.fields import QuerySelectMultipleField
 from wtforms.ext.sqlalchemy.validators import Unique
 
 __all__ = (
-    'model_fields', 'model_form',
+    'model_fields', 'model_form', 'clear_model_form_cache',
 )
 
+#: The maximum number of form classes kept by `model_form` when called with
+#: `cache=True`. The cache is emptied when it is full.
+MODEL_FORM_CACHE_SIZE = 1024
+
+_model_form_cache = {}
+
+DispatchInfo = namedtuple('DispatchInfo', ['hits', 'misses', 'currsize'])
+
 def converts(*args):
     def _inner(func):
         func._converter_for = frozenset(args)
@@ -36,21 +51,62 @@ class ModelConverterBase(object):
                     converters[classname] = obj
 
         self.converters = converters
-
-class ModelConverterBase(object):
-    def __init__(self, converters, use_mro=True):
-        self.use_mro = use_mro
-
-        if not converters:
-            converters = {}
-
-        for name in dir(self):
-            obj = getattr(self, name)
-            if hasattr(obj, '_converter_for'):
-                for classname in obj._converter_for:
-                    converters[classname] = obj
-
-        self.converters = converters
+        self.clear_dispatch()
+
+    def dispatch_info(self):
+        """
+        Returns a named tuple of the `hits`, `misses` and `currsize` of the
+        table mapping column types to converters.
+        """
+        return DispatchInfo(self._dispatch_hits, self._dispatch_misses, len(self._dispatch))
+
+    def clear_dispatch(self):
+        """
+        Empty the table mapping column types to converters. This must be
+        called after changing `converters` or `use_mro`, unless only new
+        converters were added.
+        """
+        self._dispatch = {}
+        self._dispatch_size = len(self.converters)
+        self._dispatch_hits = 0
+        self._dispatch_misses = 0
+
+    def get_converter(self, column_type):
+        """
+        Return the converter for the column type class `column_type`, or
+        `None` if there is none. The result is looked up once per type, and
+        stored in a table used for any later column of the same type.
+        """
+        if len(self.converters) != self._dispatch_size:
+            self.clear_dispatch()
+        try:
+            converter = self._dispatch[column_type]
+        except KeyError:
+            self._dispatch_misses += 1
+            converter = self._dispatch[column_type] = self._find_converter(column_type)
+        else:
+            self._dispatch_hits += 1
+        return converter
+
+    def _find_converter(self, column_type):
+        if self.use_mro:
+            types = inspect.getmro(column_type)
+        else:
+            types = [column_type]
+
+        for col_type in types:
+            type_string = '%s.%s' % (col_type.__module__,
+                col_type.__name__)
+            if type_string.startswith('sqlalchemy'):
+                type_string = type_string[11:]
+
+            if type_string in self.converters:
+                return self.converters[type_string]
+
+        for col_type in types:
+            if col_type.__name__ in self.converters:
+                return self.converters[col_type.__name__]
+        return None
 
     def convert(self, model, mapper, prop, field_args, db_session=None):
         if not hasattr(prop, 'columns') and not hasattr(prop, 'direction'):
@@ -94,27 +150,9 @@ class ModelConverterBase(object):
                 kwargs['validators'].append(Unique(lambda: db_session, model,
                     column))
 
-            if self.use_mro:
-                types = inspect.getmro(type(column.type))
-            else:
-                types = [type(column.type)]
-
-            for col_type in types:
-                type_string = '%s.%s' % (col_type.__module__,
-                    col_type.__name__)
-                if type_string.startswith('sqlalchemy'):
-                    type_string = type_string[11:]
-
-                if type_string in self.converters:
-                    converter = self.converters[type_string]
-                    break
-            else:
-                for col_type in types:
-                    if col_type.__name__ in self.converters:
-                        converter = self.converters[col_type.__name__]
-                        break
-                else:
-                    return
+            converter = self.get_converter(type(column.type))
+            if converter is None:
+                return
 
         if db_session and hasattr(prop, 'direction'):
             foreign_model = prop.mapper.class_
@@ -133,6 +171,9 @@ class ModelConverterBase(object):
 
         if field_args:
             kwargs.update(field_args)
+            # Converters add validators, which mustn't change the caller's
+            # field_args.
+            kwargs['validators'] = list(kwargs['validators'])
 
         return converter(model=model, mapper=mapper, prop=prop, column=column,
             field_args=kwargs)
@@ -215,6 +256,19 @@ class ModelConverter(ModelConverterBase):
         return QuerySelectMultipleField(**field_args)
 
 
+_default_converter = None
+
+def _get_default_converter():
+    """
+    Return the `ModelConverter` shared by calls which don't pass their own, so
+    that its table of converters by column type is reused.
+    """
+    global _default_converter
+    if _default_converter is None:
+        _default_converter = ModelConverter()
+    return _default_converter
+
+
 def model_fields(model, db_session=None, only=None, exclude=None,
     field_args=None, converter=None):
     """
@@ -226,7 +280,7 @@ def model_fields(model, db_session=None, only=None, exclude=None,
         raise TypeError('model must be a sqlalchemy mapped model')
 
     mapper = model._sa_class_manager.mapper
-    converter = converter or ModelConverter()
+    converter = converter or _get_default_converter()
     field_args = field_args or {}
 
     properties = ((p.key, p) for p in mapper.iterate_properties)
@@ -247,7 +301,7 @@ def model_fields(model, db_session=None, only=None, exclude=None,
 
 def model_form(model, db_session=None, base_class=Form, only=None,
     exclude=None, field_args=None, converter=None, exclude_pk=True,
-    exclude_fk=True, type_name=None):
+    exclude_fk=True, type_name=None, cache=False):
     """
     Create a wtforms Form for a given SQLAlchemy model class::
 
@@ -279,7 +333,43 @@ def model_form(model, db_session=None, base_class=Form, only=None,
         An optional boolean to force foreign keys exclusion.
     :param type_name:
         An optional string to set returned type name.
+    :param cache:
+        If `True`, return the same form class for every call with the same
+        arguments, rather than generating a new one each time. `converter`
+        and any unhashable values in `field_args`, such as lists of
+        validators, are compared by identity, so they must be the same
+        objects for the cached class to be reused. The generated fields
+        query through `db_session`, so classes are only cached when it is
+        `None` or a `scoped_session`, which finds the current session on
+        every query; with any other session a new class is generated. Cached
+        classes are shared, so don't modify them; use
+        `clear_model_form_cache` when models change.
     """
+    if cache and (db_session is None or isinstance(db_session, ScopedSession)):
+        key = (
+            model, db_session, base_class, frozenset(only or ()),
+            frozenset(exclude or ()), _fingerprint(field_args), converter,
+            exclude_pk, exclude_fk, type_name
+        )
+        try:
+            entry = _model_form_cache.get(key)
+        except TypeError:
+            # Unhashable converter; generate the form as usual.
+            entry = key = None
+
+        if entry is not None:
+            return entry[0]
+
+        form_class = model_form(model, db_session, base_class, only, exclude,
+            field_args, converter, exclude_pk, exclude_fk, type_name)
+        if key is not None:
+            if len(_model_form_cache) >= MODEL_FORM_CACHE_SIZE:
+                _model_form_cache.clear()
+            # field_args is kept so that the objects compared by identity
+            # stay alive as long as the entry.
+            _model_form_cache[key] = (form_class, field_args)
+        return form_class
+
     class ModelForm(base_class):
         """Sets object as form attribute."""
         def __init__(self, *args, **kwargs):
@@ -287,8 +377,7 @@ def model_form(model, db_session=None, base_class=Form, only=None,
                 self._obj = kwargs['obj']
             super(ModelForm, self).__init__(*args, **kwargs)
 
-    if not exclude:
-        exclude = []
+    exclude = list(exclude or ())
     model_mapper = model.__mapper__
     for prop in model_mapper.iterate_properties:
         if not hasattr(prop, 'direction') and prop.columns[0].primary_key:
@@ -302,3 +391,32 @@ def model_form(model, db_session=None, base_class=Form, only=None,
     field_dict = model_fields(model, db_session, only, exclude, field_args,
         converter)
     return type(type_name, (ModelForm, ), field_dict)
+
+
+def clear_model_form_cache(model=None):
+    """
+    Remove the form classes cached by `model_form`, or only those of `model`
+    if it is given.
+    """
+    if model is None:
+        _model_form_cache.clear()
+    else:
+        for key in list(_model_form_cache):
+            if key[0] is model:
+                _model_form_cache.pop(key, None)
+
+
+def _fingerprint(value):
+    """
+    Return a hashable value which is equal for equal `field_args`, comparing
+    unhashable leaves by identity.
+    """
+    if isinstance(value, dict):
+        return frozenset((k, _fingerprint(v)) for k, v in iteritems(value))
+    elif isinstance(value, (list, tuple)):
+        return tuple(_fingerprint(v) for v in value)
+    try:
+        hash(value)
+    except TypeError:
+        return (type(value), id(value))
+    return value
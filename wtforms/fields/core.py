@@ -2,16 +2,20 @@ from __future__ import unicode_literals
 
 import datetime
 import decimal
+import inspect
 import itertools
+import sys
 import time
+from collections import namedtuple
 
 from wtforms import widgets
+from wtforms.widgets.core import _defining_class, _get_iter_render
 from wtforms.compat import text_type, izip
 from wtforms.validators import StopValidation
 
 
 __all__ = (
-    'BooleanField', 'DecimalField', 'DateField', 'DateTimeField', 'FieldList',
+    'BooleanField', 'Choices', 'DecimalField', 'DateField', 'DateTimeField', 'FieldList',
     'FloatField', 'FormField', 'IntegerField', 'RadioField', 'SelectField',
     'SelectMultipleField', 'StringField',
 )
@@ -19,6 +23,20 @@ __all__ = (
 
 _unset_value = object()
 
+_isawaitable = getattr(inspect, 'isawaitable', lambda obj: False)
+
+
+def _check_sync(result, func):
+    """
+    Raise `TypeError` if `func` returned an awaitable, which only
+    `validate_async` can wait for. Only called for results other than `None`,
+    which validators normally return.
+    """
+    if _isawaitable(result):
+        if hasattr(result, 'close'):
+            result.close()
+        raise TypeError('%r returned an awaitable; use validate_async() to run async validators.' % (func, ))
+
 
 class DummyTranslations(object):
     def gettext(self, string):
@@ -31,6 +49,73 @@ class DummyTranslations(object):
         return plural
 
 
+#: The maximum number of messages kept by each `CachedTranslations`.
+TRANSLATIONS_CACHE_SIZE = 512
+
+TranslationsCacheInfo = namedtuple('TranslationsCacheInfo', ['hits', 'misses', 'maxsize', 'currsize'])
+
+
+class CachedTranslations(object):
+    """
+    Wraps a translations object, remembering the messages it returns.
+
+    This is only correct for translations objects which always return the
+    same message for the same arguments, such as one per language; objects
+    which look up the active language on every call must not be wrapped.
+    The cache is emptied when it is full.
+    """
+    def __init__(self, translations, maxsize=TRANSLATIONS_CACHE_SIZE):
+        self.translations = translations
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self._messages = {}
+
+    def gettext(self, string):
+        try:
+            message = self._messages[string]
+        except KeyError:
+            message = self.translations.gettext(string)
+            self._store(string, message)
+            return message
+        except TypeError:
+            # Unhashable, such as some lazy strings.
+            return self.translations.gettext(string)
+        self.hits += 1
+        return message
+
+    def ngettext(self, singular, plural, n):
+        key = (singular, plural, n)
+        try:
+            message = self._messages[key]
+        except KeyError:
+            message = self.translations.ngettext(singular, plural, n)
+            self._store(key, message)
+            return message
+        except TypeError:
+            return self.translations.ngettext(singular, plural, n)
+        self.hits += 1
+        return message
+
+    def _store(self, key, message):
+        self.misses += 1
+        if len(self._messages) >= self.maxsize:
+            self._messages.clear()
+        self._messages[key] = message
+
+    def cache_info(self):
+        """
+        Returns a named tuple of the `hits`, `misses`, `maxsize` and
+        `currsize` of the cache. The hit rate is ``hits / (hits + misses)``.
+        """
+        return TranslationsCacheInfo(self.hits, self.misses, self.maxsize, len(self._messages))
+
+    def cache_clear(self):
+        """ Empties the cache and resets its statistics. """
+        self._messages.clear()
+        self.hits = self.misses = 0
+
+
 class Field(object):
     """
     Field base class
@@ -41,8 +126,15 @@ class Field(object):
     validators = tuple()
     widget = None
     _formfield = True
+    _index_formdata = False
     _translations = DummyTranslations()
 
+    #: Set to `True` on a field class whose constructor only stores its
+    #: arguments and creates no per-instance state, so that `FormPlan` may
+    #: bind it by cloning a prototype. Subclasses which define their own
+    #: `__init__` must set it again; see `_is_cloneable`.
+    _cloneable = True
+
     def __new__(cls, *args, **kwargs):
         if '_form' in kwargs and '_name' in kwargs:
             return super(Field, cls).__new__(cls)
@@ -138,6 +230,55 @@ class Field(object):
         """
         return self.widget(self, **kwargs)
 
+    def iter_render(self, **kwargs):
+        """
+        Render this field as HTML in chunks, taking the same keyword args as
+        `__call__`. Joined together, the chunks are the same as the output of
+        calling the field.
+
+        Widgets which render many subfields or options provide an
+        `iter_render(field, **kwargs)` method to yield their output
+        piecewise; for other widgets, and for fields or widgets whose
+        `__call__` is overridden, the whole field is yielded at once.
+        """
+        iter_render = None
+        if _defining_class(type(self), '__call__') is Field:
+            iter_render = _get_iter_render(self.widget)
+        if iter_render is None:
+            return iter((self(**kwargs), ))
+        return iter_render(self, **kwargs)
+
+    @classmethod
+    def _is_cloneable(cls):
+        """
+        Returns `True` if fields of this class can be bound by `_clone`, which
+        is when the nearest class declaring `_cloneable` isn't a base of the
+        nearest class defining `__init__`.
+        """
+        for klass in cls.__mro__:
+            if '_cloneable' in klass.__dict__:
+                return klass.__dict__['_cloneable']
+            if '__init__' in klass.__dict__:
+                return False
+        return False
+
+    def _clone(self):
+        """
+        Return a copy of this field with its own flags, label and validators
+        list, but otherwise sharing state with this field.
+
+        This is used by `FormPlan` to bind fields from cached prototypes
+        without running the field constructor again.
+        """
+        field = object.__new__(type(self))
+        field.__dict__.update(self.__dict__)
+        field.flags = Flags()
+        field.flags.__dict__.update(self.flags.__dict__)
+        field.label = Label(self.label.field_id, self.label.text)
+        if isinstance(self.validators, list):
+            field.validators = list(self.validators)
+        return field
+
     def gettext(self, string):
         return self._translations.gettext(string)
 
@@ -161,7 +302,9 @@ class Field(object):
 
         # Call pre_validate
         try:
-            self.pre_validate(form)
+            result = self.pre_validate(form)
+            if result is not None:
+                _check_sync(result, self.pre_validate)
         except StopValidation as e:
             if e.args and e.args[0]:
                 self.errors.append(e.args[0])
@@ -171,9 +314,15 @@ class Field(object):
 
         # Run validators
         if not stop_validation:
-            for validator in itertools.chain(self.validators, extra_validators):
+            if extra_validators:
+                chain = tuple(self.validators) + tuple(extra_validators)
+            else:
+                chain = self.validators
+            for validator in chain:
                 try:
-                    validator(form, self)
+                    result = validator(form, self)
+                    if result is not None:
+                        _check_sync(result, validator)
                 except StopValidation as e:
                     if e.args and e.args[0]:
                         self.errors.append(e.args[0])
@@ -184,12 +333,17 @@ class Field(object):
 
         # Call post_validate
         try:
-            self.post_validate(form, stop_validation)
+            result = self.post_validate(form, stop_validation)
+            if result is not None:
+                _check_sync(result, self.post_validate)
         except ValueError as e:
             self.errors.append(e.args[0])
 
         return len(self.errors) == 0
 
+    if sys.version_info >= (3, 5):
+        from wtforms._async import field_validate_async as validate_async
+
     def pre_validate(self, form):
         """
         Override if you need field-level validation. Runs before any other
@@ -300,6 +454,16 @@ class UnboundField(object):
     def bind(self, form, name, prefix='', translations=None, **kwargs):
         return self.field_class(_form=form, _prefix=prefix, _name=name, _translations=translations, *self.args, **dict(self.kwargs, **kwargs))
 
+    def __get__(self, form, owner):
+        # Forms constructed lazily bind their pending fields on attribute
+        # access. Once bound, the field is set on the instance and shadows
+        # this descriptor.
+        if form is not None:
+            pending_names = getattr(form, '_pending_names', None)
+            if pending_names and self in pending_names:
+                return form[pending_names[self][0]]
+        return self
+
     def __repr__(self):
         return '<UnboundField(%s, %r, %r)>' % (self.field_class.__name__, self.args, self.kwargs)
 
@@ -358,6 +522,8 @@ class SelectFieldBase(Field):
     This isn't a field, but an abstract base class for fields which want to
     provide this functionality.
     """
+    _cloneable = True
+
     def __init__(self, label=None, validators=None, option_widget=None, **kwargs):
         super(SelectFieldBase, self).__init__(label, validators, **kwargs)
 
@@ -386,17 +552,176 @@ class SelectFieldBase(Field):
             return self.data
 
 
+class ChoiceIndex(object):
+    """
+    An index over a sequence of `(value, label)` choices, used by
+    `SelectField` to check membership with a hash lookup and to render without
+    coercing every value on every call.
+
+    Indexes over immutable choices (`Choices` or tuples of tuples) are shared
+    between all fields using the same choices object and coerce function.
+    Other choices may change in place, so they are scanned on each use, as
+    if they had no index. Use `ChoiceIndex.get` rather than constructing one.
+    """
+    #: Maximum number of indexes kept in the shared cache.
+    cache_size = 128
+    _cache = {}
+
+    def __init__(self, choices, coerce):
+        self.choices = choices
+        self.coerce = coerce
+        self._values = None
+        self._coerced = None
+
+    @classmethod
+    def get(cls, choices, coerce):
+        """
+        Return an index for `choices` and `coerce`, building it if needed.
+        """
+        if isinstance(choices, Choices):
+            return choices._get_index(coerce)
+        if type(choices) is not tuple:
+            if not hasattr(choices, '__len__'):
+                choices = list(choices)
+            return _ChoiceScan(choices, coerce)
+
+        key = (id(choices), coerce)
+        index = cls._cache.get(key)
+        if index is None or not index.matches(choices, coerce):
+            # Tuples of anything but tuples can still change in place.
+            if not all(type(c) is tuple for c in choices):
+                return _ChoiceScan(choices, coerce)
+            if len(cls._cache) >= cls.cache_size:
+                cls._cache.clear()
+            index = cls._cache[key] = cls(choices, coerce)
+        return index
+
+    def matches(self, choices, coerce):
+        """ Returns `True` if this index is still valid for `choices`. """
+        return self.choices is choices and self.coerce is coerce
+
+    @property
+    def values(self):
+        """
+        A frozenset of the raw choice values, or `None` if they aren't
+        hashable.
+        """
+        if self._values is None:
+            try:
+                self._values = frozenset(c[0] for c in self.choices)
+            except TypeError:
+                self._values = False
+        return self._values or None
+
+    @property
+    def coerced(self):
+        """ A list of the choice values, each passed through `coerce`. """
+        if self._coerced is None:
+            self._coerced = [self.coerce(c[0]) for c in self.choices]
+        return self._coerced
+
+    def __contains__(self, value):
+        values = self.values
+        if values is not None:
+            try:
+                return value in values
+            except TypeError:
+                pass
+        for v, _ in self.choices:
+            if value == v:
+                return True
+        return False
+
+
+class _ChoiceScan(ChoiceIndex):
+    """
+    Stands in for the index of choices which may change in place, scanning
+    them on each use.
+    """
+    values = None
+
+    def matches(self, choices, coerce):
+        return False
+
+
+class Choices(tuple):
+    """
+    An immutable, hashable sequence of `(value, label)` pairs, for use as the
+    `choices` of `SelectField`, `SelectMultipleField` and `RadioField`.
+
+    A `Choices` object is meant to be created once, for example at module
+    level, and shared by every form instance. The index used to validate
+    submissions and the escaped HTML of each option are computed the first
+    time they are needed and kept on the object, so labels should not be
+    lazily translated strings.
+
+    >>> COUNTRIES = Choices([('fr', 'France'), ('de', 'Germany')])
+    """
+    def __new__(cls, choices):
+        return super(Choices, cls).__new__(cls, (tuple(c) for c in choices))
+
+    def __setattr__(self, name, value):
+        raise AttributeError('Choices objects are immutable')
+
+    def __delattr__(self, name):
+        raise AttributeError('Choices objects are immutable')
+
+    def __hash__(self):
+        try:
+            return self.__dict__['_hash']
+        except KeyError:
+            h = self.__dict__['_hash'] = tuple.__hash__(self)
+            return h
+
+    def __repr__(self):
+        return 'Choices(%s)' % tuple.__repr__(self)
+
+    def _get_index(self, coerce):
+        indexes = self.__dict__.setdefault('_indexes', {})
+        try:
+            return indexes[coerce]
+        except KeyError:
+            index = indexes[coerce] = ChoiceIndex(self, coerce)
+            return index
+
+    def rendered_options(self, render_option):
+        """
+        Return a tuple with an `(unselected, selected)` pair of HTML strings
+        for each choice, as rendered by `render_option(value, label, selected)`.
+
+        The result is cached for each distinct `render_option` callable.
+        """
+        rendered = self.__dict__.setdefault('_rendered', {})
+        try:
+            return rendered[render_option]
+        except KeyError:
+            options = rendered[render_option] = tuple(
+                (render_option(value, label, False), render_option(value, label, True))
+                for value, label in self
+            )
+            return options
+
+
 class SelectField(SelectFieldBase):
     widget = widgets.Select()
+    _choice_index = None
+    _cloneable = True
 
     def __init__(self, label=None, validators=None, coerce=text_type, choices=None, **kwargs):
         super(SelectField, self).__init__(label, validators, **kwargs)
         self.coerce = coerce
         self.choices = choices
 
+    def _get_choice_index(self):
+        index = self._choice_index
+        if index is None or not index.matches(self.choices, self.coerce):
+            index = self._choice_index = ChoiceIndex.get(self.choices, self.coerce)
+        return index
+
     def iter_choices(self):
-        for value, label in self.choices:
-            yield (value, label, self.coerce(value) == self.data)
+        index = self._get_choice_index()
+        for (value, label), coerced in izip(index.choices, index.coerced):
+            yield (value, label, coerced == self.data)
 
     def process_data(self, value):
         try:
@@ -412,10 +737,7 @@ class SelectField(SelectFieldBase):
                 raise ValueError(self.gettext('Invalid Choice: could not coerce'))
 
     def pre_validate(self, form):
-        for v, _ in self.choices:
-            if self.data == v:
-                break
-        else:
+        if self.data not in self._get_choice_index():
             raise ValueError(self.gettext('Not a valid choice'))
 
 
@@ -428,8 +750,15 @@ class SelectMultipleField(SelectField):
     widget = widgets.Select(multiple=True)
 
     def iter_choices(self):
-        for value, label in self.choices:
-            selected = self.data is not None and self.coerce(value) in self.data
+        index = self._get_choice_index()
+        data = self.data
+        if data is not None:
+            try:
+                data = frozenset(data)
+            except TypeError:
+                pass
+        for (value, label), coerced in izip(index.choices, index.coerced):
+            selected = data is not None and coerced in data
             yield (value, label, selected)
 
     def process_data(self, value):
@@ -446,9 +775,9 @@ class SelectMultipleField(SelectField):
 
     def pre_validate(self, form):
         if self.data:
-            values = list(c[0] for c in self.choices)
+            index = self._get_choice_index()
             for d in self.data:
-                if d not in values:
+                if d not in index:
                     raise ValueError(self.gettext("'%(value)s' is not a valid choice for this field") % dict(value=d))
 
 
@@ -486,6 +815,7 @@ class IntegerField(Field):
     is ignored and will not be accepted as a value.
     """
     widget = widgets.TextInput()
+    _cloneable = True
 
     def __init__(self, label=None, validators=None, **kwargs):
         super(IntegerField, self).__init__(label, validators, **kwargs)
@@ -520,6 +850,7 @@ class DecimalField(Field):
         current thread's context.
     """
     widget = widgets.TextInput()
+    _cloneable = True
 
     def __init__(self, label=None, validators=None, places=2, rounding=None, **kwargs):
         super(DecimalField, self).__init__(label, validators, **kwargs)
@@ -560,6 +891,7 @@ class FloatField(Field):
     is ignored and will not be accepted as a value.
     """
     widget = widgets.TextInput()
+    _cloneable = True
 
     def __init__(self, label=None, validators=None, **kwargs):
         super(FloatField, self).__init__(label, validators, **kwargs)
@@ -586,6 +918,7 @@ class BooleanField(Field):
     Represents an ``<input type="checkbox">``.
     """
     widget = widgets.CheckboxInput()
+    _cloneable = True
 
     def __init__(self, label=None, validators=None, **kwargs):
         super(BooleanField, self).__init__(label, validators, **kwargs)
@@ -611,6 +944,7 @@ class DateTimeField(Field):
     A text field which stores a `datetime.datetime` matching a format.
     """
     widget = widgets.TextInput()
+    _cloneable = True
 
     def __init__(self, label=None, validators=None, format='%Y-%m-%d %H:%M:%S', **kwargs):
         super(DateTimeField, self).__init__(label, validators, **kwargs)
@@ -636,6 +970,8 @@ class DateField(DateTimeField):
     """
     Same as DateTimeField, except stores a `datetime.date`.
     """
+    _cloneable = True
+
     def __init__(self, label=None, validators=None, format='%Y-%m-%d', **kwargs):
         super(DateField, self).__init__(label, validators, format, **kwargs)
 
@@ -660,6 +996,8 @@ class FormField(Field):
         prefix to enclosed fields. The default is fine for most uses.
     """
     widget = widgets.TableWidget()
+    _index_formdata = True
+    _cloneable = True
 
     def __init__(self, form_class, label=None, validators=None, separator='-', **kwargs):
         super(FormField, self).__init__(label, validators, **kwargs)
@@ -692,6 +1030,9 @@ class FormField(Field):
             raise TypeError('FormField does not accept in-line validators, as it gets errors from the enclosed form.')
         return self.form.validate()
 
+    if sys.version_info >= (3, 5):
+        from wtforms._async import form_field_validate_async as validate_async
+
     def populate_obj(self, obj, name):
         candidate = getattr(obj, name, None)
         if candidate is None:
@@ -739,6 +1080,8 @@ class FieldList(Field):
         formdata.
     """
     widget=widgets.ListWidget()
+    _index_formdata = True
+    _cloneable = True
 
     def __init__(self, unbound_field, label=None, validators=None, min_entries=0,
                  max_entries=None, default=tuple(), **kwargs):
@@ -756,6 +1099,7 @@ class FieldList(Field):
 
     def process(self, formdata, data=_unset_value):
         self.entries = []
+        self.last_index = -1
         if data is _unset_value or not data:
             try:
                 data = self.default()
@@ -790,9 +1134,17 @@ class FieldList(Field):
         formdata must be an object which will produce keys when iterated.  For
         example, if field 'foo' contains keys 'foo-0-bar', 'foo-1-baz', then
         the numbers 0 and 1 will be yielded, but not neccesarily in order.
+
+        If formdata provides a `keys_with_prefix` method, such as
+        `wtforms.form.IndexedInputWrapper`, it is used instead of iterating
+        over every key.
         """
         offset = len(prefix) + 1
-        for k in formdata:
+        if hasattr(formdata, 'keys_with_prefix'):
+            keys = formdata.keys_with_prefix(prefix)
+        else:
+            keys = formdata
+        for k in keys:
             if k.startswith(prefix):
                 k = k[offset:].split('-', 1)[0]
                 if k.isdigit():
@@ -807,6 +1159,9 @@ class FieldList(Field):
                 self.errors.append(subfield.errors)
         return success
 
+    if sys.version_info >= (3, 5):
+        from wtforms._async import field_list_validate_async as validate_async
+
     def populate_obj(self, obj, name):
         values = getattr(obj, name, None)
         try:
@@ -1,4 +1,5 @@
 import sys
+from bisect import bisect_left
 
 __all__ = (
     'BaseForm',
@@ -6,6 +7,13 @@ __all__ = (
 )
 
 from wtforms.compat import with_metaclass, iteritems, itervalues
+from wtforms.fields.core import CachedTranslations
+
+#: The maximum number of translations objects wrapped for forms which cache
+#: translated messages.
+CACHED_TRANSLATIONS_SIZE = 64
+
+_cached_translations = {}
 
 class BaseForm(object):
     """
@@ -13,13 +21,25 @@ class BaseForm(object):
     validation, and data and error proxying.
     """
 
-    def __init__(self, fields, prefix=''):
+    #: When `True`, the translations object returned by `_get_translations`
+    #: is wrapped in a `CachedTranslations`, shared by every form using that
+    #: object, so repeated labels and messages are only translated once, and
+    #: translated labels may be kept in `FormPlan` prototypes. Only set this
+    #: on forms whose translations object returns the same message for the
+    #: same arguments, such as one object per language.
+    CACHE_TRANSLATIONS = False
+
+    def __init__(self, fields, prefix='', lazy=False):
         """
         :param fields:
             A dict or sequence of 2-tuples of partially-constructed fields.
         :param prefix:
             If provided, all fields will have their name prefixed with the
             value.
+        :param lazy:
+            If `True`, fields are not bound or processed until they are first
+            accessed, either directly by name or by anything which needs all
+            fields, such as iteration, `data` and `validate`.
         """
         if prefix and prefix[-1] not in '-_;:/.':
             prefix += '-'
@@ -27,37 +47,111 @@ class BaseForm(object):
         self._prefix = prefix
         self._errors = None
         self._fields = {}
-
-        if hasattr(fields, 'iteritems'):
-            fields = fields.iteritems()
-        elif hasattr(fields, 'items'):
-            fields = fields.items()
+        self._pending = {}
+        self._pending_names = {}
+        self._process_args = None
 
         translations = self._get_translations()
-
-        for name, unbound_field in fields:
-            field = unbound_field.bind(form=self, name=name, prefix=prefix, translations=translations)
+        if translations is not None:
+            if self.CACHE_TRANSLATIONS:
+                translations = _get_cached_translations(translations)
+            elif hasattr(fields, 'bind_fields'):
+                # Labels translated by an object which may pick the language
+                # on each call can't be kept in prototype fields.
+                fields = fields.unbound_fields
+
+        if not hasattr(fields, 'bind_fields'):
+            if hasattr(fields, 'iteritems'):
+                fields = fields.iteritems()
+            elif hasattr(fields, 'items'):
+                fields = fields.items()
+
+        if lazy:
+            self._field_source = fields
+            self._translations = translations
+            for name, unbound_field in fields:
+                self._pending[name] = unbound_field
+                self._pending_names.setdefault(unbound_field, []).append(name)
+
+            # A field aliased under several names can't be resolved by
+            # attribute access, so bind those right away.
+            for unbound_field, names in list(self._pending_names.items()):
+                if len(names) > 1:
+                    for name in list(names):
+                        self._bind_pending(name)
+            return
+
+        if hasattr(fields, 'bind_fields'):
+            bound_fields = fields.bind_fields(form=self, prefix=prefix, translations=translations)
+        else:
+            bound_fields = (
+                (name, unbound_field.bind(form=self, name=name, prefix=prefix, translations=translations))
+                for name, unbound_field in fields
+            )
+
+        for name, field in bound_fields:
             self._fields[name] = field
 
     def __iter__(self):
         """ Iterate form fields in arbitrary order """
+        if self._pending:
+            self._bind_all()
         return iter(itervalues(self._fields))
 
     def __contains__(self, name):
         """ Returns `True` if the named field is a member of this form. """
-        return (name in self._fields)
+        return (name in self._fields or name in self._pending)
 
     def __getitem__(self, name):
         """ Dict-style access to this form's fields."""
-        return self._fields[name]
+        try:
+            return self._fields[name]
+        except KeyError:
+            if name in self._pending:
+                return self._bind_pending(name)
+            raise
 
     def __setitem__(self, name, value):
         """ Bind a field to this form. """
+        if name in self._pending:
+            self._discard_pending(name)
         self._fields[name] = value.bind(form=self, name=name, prefix=self._prefix)
 
     def __delitem__(self, name):
         """ Remove a field from this form. """
-        del self._fields[name]
+        if name in self._pending:
+            self._discard_pending(name)
+        else:
+            del self._fields[name]
+
+    def _discard_pending(self, name):
+        unbound_field = self._pending.pop(name)
+        names = self._pending_names[unbound_field]
+        names.remove(name)
+        if not names:
+            del self._pending_names[unbound_field]
+        return unbound_field
+
+    def _bind_pending(self, name):
+        """
+        Bind, and if the form has been processed, process the pending field
+        `name` of a lazy form.
+        """
+        unbound_field = self._discard_pending(name)
+        if hasattr(self._field_source, 'bind_field'):
+            field = self._field_source.bind_field(name, form=self, prefix=self._prefix, translations=self._translations)
+        else:
+            field = unbound_field.bind(form=self, name=name, prefix=self._prefix, translations=self._translations)
+        self._fields[name] = field
+
+        if self._process_args is not None:
+            formdata, obj, kwargs = self._process_args
+            self._process_field(name, field, formdata, obj, kwargs)
+        return field
+
+    def _bind_all(self):
+        for name in list(self._pending):
+            self._bind_pending(name)
 
     def _get_translations(self):
         """
@@ -75,6 +169,8 @@ class BaseForm(object):
         :note: This is a destructive operation; Any attribute with the same name
                as a field will be overridden. Use with caution.
         """
+        if self._pending:
+            self._bind_all()
         for name, field in iteritems(self._fields):
             field.populate_obj(obj, name)
 
@@ -101,13 +197,61 @@ class BaseForm(object):
             else:
                 raise TypeError("formdata should be a multidict-type wrapper that supports the 'getlist' method")
 
+        if formdata is not None and not hasattr(formdata, 'keys_with_prefix') and self._wants_indexed_formdata():
+            formdata = IndexedInputWrapper(formdata)
+
         for name, field, in iteritems(self._fields):
-            if obj is not None and hasattr(obj, name):
-                field.process(formdata, getattr(obj, name))
-            elif name in kwargs:
-                field.process(formdata, kwargs[name])
-            else:
-                field.process(formdata)
+            self._process_field(name, field, formdata, obj, kwargs)
+
+        if self._pending:
+            self._process_args = (formdata, obj, kwargs)
+
+    def _wants_indexed_formdata(self):
+        """
+        Returns `True` if any field looks up formdata keys by prefix, in which
+        case `process` wraps its formdata in an `IndexedInputWrapper`.
+        """
+        for field in itervalues(self._fields):
+            if field._index_formdata:
+                return True
+        for unbound_field in itervalues(self._pending):
+            if getattr(unbound_field.field_class, '_index_formdata', False):
+                return True
+        return False
+
+    def _iter_validate(self, rows, obj=None, kwargs=None):
+        """
+        Process and validate each of `rows` in turn with this form's fields,
+        yielding a `(data, errors)` tuple for each.
+
+        Rows which are plain mappings, rather than multidicts, are wrapped in a
+        `DictInputWrapper`. The state a field only sets when it is given
+        formdata is reset before each row, so that an empty row isn't
+        validated with the raw data of the previous one.
+        """
+        if kwargs is None:
+            kwargs = {}
+        if self._pending:
+            self._bind_all()
+        fields = list(itervalues(self._fields))
+        for row in rows:
+            if row is not None and not hasattr(row, 'getlist') and not hasattr(row, 'getall'):
+                row = DictInputWrapper(row)
+            for field in fields:
+                field.raw_data = None
+                field.process_errors = tuple()
+                field.errors = tuple()
+            self.process(row, obj, **kwargs)
+            self.validate()
+            yield self.data, self.errors
+
+    def _process_field(self, name, field, formdata, obj, kwargs):
+        if obj is not None and hasattr(obj, name):
+            field.process(formdata, getattr(obj, name))
+        elif name in kwargs:
+            field.process(formdata, kwargs[name])
+        else:
+            field.process(formdata)
 
     def validate(self, extra_validators=None):
         """
@@ -120,6 +264,8 @@ class BaseForm(object):
 
         Returns `True` if no errors occur.
         """
+        if self._pending:
+            self._bind_all()
         self._errors = None
         success = True
         for name, field in iteritems(self._fields):
@@ -131,8 +277,13 @@ class BaseForm(object):
                 success = False
         return success
 
+    if sys.version_info >= (3, 5):
+        from wtforms._async import base_form_validate_async as validate_async
+
     @property
     def data(self):
+        if self._pending:
+            self._bind_all()
         return dict((name, f.data) for name, f in iteritems(self._fields))
 
     @property
@@ -142,6 +293,92 @@ class BaseForm(object):
         return self._errors
 
 
+class FormPlan(object):
+    """
+    A precompiled description of how to bind the fields of a form class.
+
+    The first time a form is bound with a given prefix and translations
+    object, every field is constructed once as a prototype, which computes its
+    name, id, label, flags and validators. Later bindings with the same prefix
+    and translations clone the prototypes instead of running each field's
+    constructor again. Fields whose class isn't declared safe to clone (see
+    `Field._cloneable`) are constructed every time.
+
+    Iterating a plan produces the same `(name, unbound_field)` pairs it was
+    created with, so it can be used anywhere a sequence of unbound fields is
+    expected.
+
+    :param unbound_fields:
+        A sequence of `(name, unbound_field)` 2-tuples.
+    """
+    #: Maximum number of distinct (prefix, translations) prototype sets kept.
+    cache_size = 64
+
+    def __init__(self, unbound_fields):
+        self.unbound_fields = unbound_fields
+        self._by_name = dict(unbound_fields)
+        self._prototypes = {}
+
+    def __iter__(self):
+        return iter(self.unbound_fields)
+
+    def __len__(self):
+        return len(self.unbound_fields)
+
+    def _get_prototypes(self, prefix, translations):
+        """
+        Return a `(list, dict)` pair of the prototype fields for `prefix` and
+        `translations`, or `None` if they can't be cached.
+        """
+        key = (prefix, translations)
+        try:
+            prototypes = self._prototypes.get(key)
+        except TypeError:
+            # Unhashable translations objects can't be cached.
+            return None
+
+        if prototypes is None:
+            if len(self._prototypes) >= self.cache_size:
+                self._prototypes.clear()
+            fields = []
+            for name, unbound_field in self.unbound_fields:
+                if unbound_field.field_class._is_cloneable():
+                    prototype = unbound_field.bind(form=None, name=name, prefix=prefix, translations=translations)
+                else:
+                    prototype = None
+                fields.append((name, prototype))
+            prototypes = self._prototypes[key] = (fields, dict(fields))
+        return prototypes
+
+    def bind_fields(self, form, prefix='', translations=None):
+        """
+        Return a list of `(name, field)` pairs bound to `form`.
+        """
+        prototypes = self._get_prototypes(prefix, translations)
+        if prototypes is None:
+            return [
+                (name, unbound_field.bind(form=form, name=name, prefix=prefix, translations=translations))
+                for name, unbound_field in self.unbound_fields
+            ]
+
+        return [
+            (name, prototype._clone() if prototype is not None else
+             self._by_name[name].bind(form=form, name=name, prefix=prefix, translations=translations))
+            for name, prototype in prototypes[0]
+        ]
+
+    def bind_field(self, name, form, prefix='', translations=None):
+        """
+        Return the single field `name` bound to `form`.
+        """
+        prototypes = self._get_prototypes(prefix, translations)
+        prototype = prototypes and prototypes[1][name]
+        if prototype is None:
+            unbound_field = self._by_name[name]
+            return unbound_field.bind(form=form, name=name, prefix=prefix, translations=translations)
+        return prototype._clone()
+
+
 class FormMeta(type):
     """
     The metaclass for `Form` and any subclasses of `Form`.
@@ -152,12 +389,22 @@ class FormMeta(type):
     If any fields are added/removed from the form, the list is cleared to be
     re-generated on the next instantiaton.
 
+    Alongside `_unbound_fields`, a `FormPlan` is stored as `_plan`, which
+    caches prototype fields so that instantiating the form does not need to
+    run every field's constructor. It is cleared along with `_unbound_fields`.
+
+    The in-line `validate_<fieldname>` validators of the form are likewise
+    looked up once and stored in `_inline_validators`, which is cleared when
+    fields or attributes starting with `validate_` change.
+
     Any properties which begin with an underscore or are not `UnboundField`
     instances are ignored by the metaclass.
     """
     def __init__(cls, name, bases, attrs):
         type.__init__(cls, name, bases, attrs)
         cls._unbound_fields = None
+        cls._plan = None
+        cls._inline_validators = None
 
     def __call__(cls, *args, **kwargs):
         """
@@ -175,6 +422,9 @@ class FormMeta(type):
             # to ensure a stable sort.
             fields.sort(key=lambda x: (x[1].creation_counter, x[0]))
             cls._unbound_fields = fields
+            cls._plan = FormPlan(fields)
+        if cls._inline_validators is None:
+            cls._inline_validators = _find_inline_validators(cls, (name for name, _ in cls._unbound_fields))
         return type.__call__(cls, *args, **kwargs)
 
     def __setattr__(cls, name, value):
@@ -183,6 +433,10 @@ class FormMeta(type):
         """
         if not name.startswith('_') and hasattr(value, '_formfield'):
             cls._unbound_fields = None
+            cls._plan = None
+            cls._inline_validators = None
+        elif name.startswith('validate_'):
+            cls._inline_validators = None
         type.__setattr__(cls, name, value)
 
     def __delattr__(cls, name):
@@ -192,9 +446,48 @@ class FormMeta(type):
         """
         if not name.startswith('_'):
             cls._unbound_fields = None
+            cls._plan = None
+            cls._inline_validators = None
         type.__delattr__(cls, name)
 
 
+def _get_cached_translations(translations):
+    """
+    Return the `CachedTranslations` shared by forms using `translations`.
+    """
+    try:
+        cached = _cached_translations.get(translations)
+    except TypeError:
+        # Unhashable translations objects can't be shared.
+        return CachedTranslations(translations)
+    if cached is None:
+        if len(_cached_translations) >= CACHED_TRANSLATIONS_SIZE:
+            _cached_translations.clear()
+        cached = _cached_translations[translations] = CachedTranslations(translations)
+    return cached
+
+
+def _find_inline_validators(cls, names):
+    """
+    Return a dict mapping each of `names` which has an in-line validator on
+    `cls` to a tuple containing that validator.
+
+    Methods of the form classes themselves, such as `Form.validate_many`, are
+    not in-line validators, even if a field has a matching name.
+    """
+    validators = {}
+    for name in names:
+        attr = 'validate_%s' % name
+        inline = getattr(cls, attr, None)
+        if inline is not None:
+            for klass in cls.__mro__:
+                if attr in klass.__dict__:
+                    break
+            if klass not in (BaseForm, Form):
+                validators[name] = (inline, )
+    return validators
+
+
 class Form(with_metaclass(FormMeta, BaseForm)):
     """
     Declarative Form base class. Extends BaseForm's core behaviour allowing
@@ -204,6 +497,17 @@ class Form(with_metaclass(FormMeta, BaseForm)):
     and passed to `process()`.
     """
 
+    #: When `True`, fields are bound by cloning prototypes cached in the
+    #: class's `FormPlan`. Prototypes are only used for fields which declare
+    #: themselves safe to clone, and only when `_get_translations` returns
+    #: `None` or the form sets `CACHE_TRANSLATIONS`. Set to `False` on
+    #: subclasses whose field construction depends on other per-request state.
+    CACHE_PLAN = True
+
+    #: When `True`, fields are bound and processed on first access instead of
+    #: during construction. See the `lazy` parameter of `BaseForm`.
+    LAZY = False
+
     def __init__(self, formdata=None, obj=None, prefix='', **kwargs):
         """
         :param formdata:
@@ -221,7 +525,8 @@ class Form(with_metaclass(FormMeta, BaseForm)):
             an attribute named the same as a field, form will assign the value
             of a matching keyword argument to the field, if one exists.
         """
-        super(Form, self).__init__(self._unbound_fields, prefix=prefix)
+        fields = self._plan if self.CACHE_PLAN else self._unbound_fields
+        super(Form, self).__init__(fields, prefix=prefix, lazy=self.LAZY)
 
         for name, field in iteritems(self._fields):
             # Set all the fields to attributes so that they obscure the class
@@ -232,17 +537,52 @@ class Form(with_metaclass(FormMeta, BaseForm)):
 
     def __iter__(self):
         """ Iterate form fields in their order of definition on the form. """
+        if self._pending:
+            self._bind_all()
         for name, _ in self._unbound_fields:
             if name in self._fields:
                 yield self._fields[name]
 
+    @classmethod
+    def validate_many(cls, rows, obj=None, prefix='', **kwargs):
+        """
+        Validate many submissions, such as the rows of a bulk import, using a
+        single instance of this form.
+
+        The fields are bound once, then processed and validated again for each
+        row, which is much cheaper than constructing a form per row. Inline
+        `validate_<fieldname>` validators are run as usual, on the shared form
+        instance.
+
+        :param rows:
+            An iterable of formdata, one per submission. Each may be a
+            multidict, as accepted by `process()`, or a plain mapping of field
+            names to values or lists of values.
+        :param obj:
+            If provided, used as the object data for every row.
+        :param prefix:
+            The prefix to use for the form, as with the constructor.
+        :param `**kwargs`:
+            Used as the keyword data for every row.
+
+        Returns a list of `(data, errors)` tuples in the order of `rows`, where
+        `errors` is empty for rows which validated.
+        """
+        form = cls(prefix=prefix)
+        return list(form._iter_validate(rows, obj, kwargs))
+
     def __setitem__(self, name, value):
         raise TypeError('Fields may not be added to Form instances, only classes.')
 
     def __delitem__(self, name):
-        del self._fields[name]
+        super(Form, self).__delitem__(name)
         setattr(self, name, None)
 
+    def _bind_pending(self, name):
+        field = super(Form, self)._bind_pending(name)
+        setattr(self, name, field)
+        return field
+
     def __delattr__(self, name):
         try:
             self.__delitem__(name)
@@ -254,13 +594,23 @@ class Form(with_metaclass(FormMeta, BaseForm)):
         Validates the form by calling `validate` on each field, passing any
         extra `Form.validate_<fieldname>` validators to the field validator.
         """
-        extra = {}
-        for name in self._fields:
-            inline = getattr(self.__class__, 'validate_%s' % name, None)
-            if inline is not None:
-                extra[name] = [inline]
+        if self._pending:
+            self._bind_all()
+        return super(Form, self).validate(self._get_inline_validators())
 
-        return super(Form, self).validate(extra)
+    def _get_inline_validators(self):
+        """
+        Return a dict mapping field names to a tuple of their in-line
+        validators, as found by `FormMeta`.
+        """
+        extra = self._inline_validators
+        if extra is None:
+            # The class has changed since this form was created.
+            extra = _find_inline_validators(self.__class__, self._fields)
+        return extra
+
+    if sys.version_info >= (3, 5):
+        from wtforms._async import form_validate_async as validate_async
 
 
 class WebobInputWrapper(object):
@@ -293,3 +643,87 @@ class WebobInputWrapper(object):
     def getlist(self, name):
         return self._wrapped.getall(name)
 
+
+class DictInputWrapper(object):
+    """
+    Wrap a plain mapping, such as a decoded JSON object or a CSV row, for use
+    as `formdata`.
+
+    Values which are lists or tuples are used as the list of values for their
+    key; any other value is treated as a single value, and `None` as no value.
+    """
+
+    def __init__(self, data):
+        self._wrapped = data
+
+    def __iter__(self):
+        return iter(self._wrapped)
+
+    def __len__(self):
+        return len(self._wrapped)
+
+    def __contains__(self, name):
+        return (name in self._wrapped)
+
+    def getlist(self, name):
+        value = self._wrapped.get(name)
+        if value is None:
+            return []
+        elif isinstance(value, (list, tuple)):
+            return list(value)
+        return [value]
+
+
+class IndexedInputWrapper(object):
+    """
+    Wrap `formdata` to look up keys by prefix using a sorted index.
+
+    `BaseForm.process` wraps its formdata with this when the form has fields
+    with `_index_formdata` set, such as `FieldList` and `FormField`. The index
+    is built at most once per call and is shared by every field processed
+    with it, including the fields of enclosed forms. `FieldList` uses it to
+    find the keys of its entries without scanning every key in the formdata.
+
+    Item lookups and all other attributes are passed through to the wrapped
+    object.
+    """
+
+    def __init__(self, formdata):
+        self._wrapped = formdata
+        self._keys = None
+        self.getlist = formdata.getlist
+
+    def __iter__(self):
+        return iter(self._wrapped)
+
+    def __len__(self):
+        return len(self._wrapped)
+
+    def __bool__(self):
+        return bool(self._wrapped)
+
+    __nonzero__ = __bool__
+
+    def __contains__(self, name):
+        return (name in self._wrapped)
+
+    def __getitem__(self, name):
+        return self._wrapped[name]
+
+    def __getattr__(self, name):
+        return getattr(self._wrapped, name)
+
+    def keys_with_prefix(self, prefix):
+        """
+        Return a list of the keys which start with `prefix`, in sorted order.
+        """
+        keys = self._keys
+        if keys is None:
+            keys = self._keys = sorted(self._wrapped)
+
+        start = end = bisect_left(keys, prefix)
+        num_keys = len(keys)
+        while end < num_keys and keys[end].startswith(prefix):
+            end += 1
+        return keys[start:end]
+
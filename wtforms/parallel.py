@@ -0,0 +1,202 @@
+"""
+Parallel validation of large batches of submissions.
+
+Rows are split into chunks, which are validated in worker processes with
+`Form.validate_many`. Workers are given the import path of the form class
+rather than the class itself, so only the path and the row data need to be
+pickled. Chunks are read from the rows and pickled as workers become free,
+so a large import is never held in memory all at once, and a chunk which
+can't be pickled is validated in this process instead.
+
+This requires the `concurrent.futures` module, which is part of the standard
+library from Python 3.2 and available for older versions as the `futures`
+package.
+"""
+from __future__ import unicode_literals
+
+import multiprocessing
+import pickle
+import sys
+from collections import deque
+from itertools import islice
+
+try:
+    from concurrent import futures
+except ImportError:
+    futures = None
+
+__all__ = ('validate_parallel', )
+
+#: The default number of rows validated by each task.
+CHUNK_SIZE = 500
+
+
+def validate_parallel(form_class, rows, chunk_size=CHUNK_SIZE, max_workers=None,
+                      use_processes=True, prefix='', **kwargs):
+    """
+    Validate `rows` with `form_class` in parallel.
+
+    Rows are validated in chunks of `chunk_size` by a pool of worker
+    processes. Forms which can't be used by another process, because they
+    can't be imported by name (for example, classes created in a function) or
+    because `kwargs` can't be pickled, are validated by a pool of threads
+    instead. A chunk of rows which can't be pickled is validated in this
+    process. Threads only help when validation releases the GIL, such as
+    validators which query a database. If `concurrent.futures` is not
+    available, the rows are validated in this process.
+
+    :param form_class:
+        The `Form` subclass to validate the rows with.
+    :param rows:
+        An iterable of formdata, as accepted by `Form.validate_many`.
+    :param chunk_size:
+        The number of rows in each task. Larger chunks have less overhead,
+        smaller ones spread the work across workers more evenly.
+    :param max_workers:
+        The maximum number of workers, passed to the executor. Only twice
+        this many chunks are read from `rows` ahead of the results.
+    :param use_processes:
+        If `False`, always use a pool of threads.
+    :param prefix:
+        The prefix to use for the form, as with the constructor.
+    :param `**kwargs`:
+        Used as the keyword data for every row. Must be picklable to use
+        processes.
+
+    Returns a list of `(data, errors)` tuples in the order of `rows`, as
+    `Form.validate_many` does.
+    """
+    if chunk_size < 1:
+        raise ValueError('chunk_size must be at least 1.')
+
+    chunks = _iter_chunks(rows, chunk_size)
+    if futures is None:
+        return _merge(_validate_chunk(form_class, chunk, prefix, kwargs) for chunk in chunks)
+
+    if use_processes:
+        form_path = _get_import_path(form_class)
+        if form_path is not None and _can_pickle(kwargs):
+            if max_workers is None:
+                max_workers = _cpu_count()
+            tasks = _iter_process_tasks(form_class, form_path, chunks, prefix, kwargs)
+            with futures.ProcessPoolExecutor(max_workers=max_workers) as executor:
+                return _merge(_iter_results(executor, tasks, 2 * max_workers))
+
+    if max_workers is None:
+        max_workers = 4
+    tasks = ((_validate_chunk, (form_class, chunk, prefix, kwargs)) for chunk in chunks)
+    with futures.ThreadPoolExecutor(max_workers=max_workers) as executor:
+        return _merge(_iter_results(executor, tasks, 2 * max_workers))
+
+
+def _validate_chunk(form_class, rows, prefix, kwargs):
+    """
+    Validate a chunk of rows, in a worker. `form_class` may be the import path
+    of the form class.
+    """
+    if not isinstance(form_class, type):
+        form_class = _import_form(form_class)
+    return form_class.validate_many(rows, prefix=prefix, **kwargs)
+
+
+def _validate_pickled_chunk(form_path, payload, prefix, kwargs):
+    """
+    Validate a chunk of rows pickled by `_iter_process_tasks`, in a worker
+    process.
+    """
+    return _validate_chunk(form_path, pickle.loads(payload), prefix, kwargs)
+
+
+def _iter_process_tasks(form_class, form_path, chunks, prefix, kwargs):
+    """
+    Yield a `(func, args)` task for each of `chunks`, pickling the chunk for
+    a worker process, or `(None, result)` with the result of validating it in
+    this process if it can't be pickled.
+    """
+    for chunk in chunks:
+        try:
+            payload = pickle.dumps(chunk, pickle.HIGHEST_PROTOCOL)
+        except Exception:
+            yield None, _validate_chunk(form_class, chunk, prefix, kwargs)
+        else:
+            yield _validate_pickled_chunk, (form_path, payload, prefix, kwargs)
+
+
+def _iter_results(executor, tasks, max_pending):
+    """
+    Submit `tasks`, an iterable of `(func, args)` pairs, to `executor` and
+    yield their results in order. A task without a function holds its result
+    in place of the arguments. At most `max_pending` tasks are submitted ahead
+    of the result being waited for, so `tasks` is only read as fast as it is
+    run.
+    """
+    pending = deque()
+    for func, args in tasks:
+        if len(pending) >= max_pending:
+            yield pending.popleft().result()
+        if func is None:
+            pending.append(_Done(args))
+        else:
+            pending.append(executor.submit(func, *args))
+    while pending:
+        yield pending.popleft().result()
+
+
+class _Done(object):
+    """ Stands in for the future of a task which was run in this process. """
+    def __init__(self, result):
+        self._result = result
+
+    def result(self):
+        return self._result
+
+
+def _iter_chunks(rows, chunk_size):
+    rows = iter(rows)
+    while True:
+        chunk = list(islice(rows, chunk_size))
+        if not chunk:
+            return
+        yield chunk
+
+
+def _merge(results):
+    merged = []
+    for result in results:
+        merged.extend(result)
+    return merged
+
+
+def _get_import_path(form_class):
+    """
+    Return the import path of `form_class`, or `None` if the class can't be
+    imported by that path.
+    """
+    path = '%s:%s' % (form_class.__module__, form_class.__name__)
+    try:
+        if _import_form(path) is form_class:
+            return path
+    except (ImportError, AttributeError):
+        pass
+    return None
+
+
+def _import_form(path):
+    module_name, class_name = path.split(':')
+    __import__(module_name)
+    return getattr(sys.modules[module_name], class_name)
+
+
+def _can_pickle(obj):
+    try:
+        pickle.dumps(obj, pickle.HIGHEST_PROTOCOL)
+    except Exception:
+        return False
+    return True
+
+
+def _cpu_count():
+    try:
+        return multiprocessing.cpu_count()
+    except NotImplementedError:
+        return 1
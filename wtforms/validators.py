@@ -1,6 +1,14 @@
 from __future__ import unicode_literals
 
+import itertools
 import re
+import threading
+from collections import namedtuple
+
+try:
+    from functools import lru_cache
+except ImportError:
+    lru_cache = None
 
 from wtforms.compat import string_types
 
@@ -13,6 +21,84 @@ __all__ = (
 )
 
 
+#: The maximum number of compiled regular expressions kept by `Regexp` and the
+#: validators based on it.
+REGEX_CACHE_SIZE = 256
+
+RegexCacheInfo = namedtuple('RegexCacheInfo', ['hits', 'misses', 'maxsize', 'currsize'])
+
+
+class _RegexCache(object):
+    """
+    A least recently used cache of compiled regular expressions, with the same
+    interface as a function wrapped by `functools.lru_cache`, which is used
+    instead where available.
+
+    Patterns are looked up without a lock, but the use of a hit is recorded
+    under it, so that a pattern being evicted by another thread isn't left
+    behind in the record of last uses.
+    """
+    def __init__(self, maxsize):
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self._patterns = {}
+        self._last_used = {}
+        self._counter = itertools.count()
+        self._lock = threading.Lock()
+
+    def __call__(self, regex, flags=0):
+        key = (type(regex), regex, flags)
+        pattern = self._patterns.get(key)
+        if pattern is not None:
+            with self._lock:
+                if key in self._patterns:
+                    self._last_used[key] = next(self._counter)
+                self.hits += 1
+            return pattern
+
+        pattern = re.compile(regex, flags)
+        with self._lock:
+            self.misses += 1
+            if key not in self._patterns and len(self._patterns) >= self.maxsize:
+                oldest = min(self._last_used, key=self._last_used.get)
+                del self._patterns[oldest], self._last_used[oldest]
+            self._patterns[key] = pattern
+            self._last_used[key] = next(self._counter)
+        return pattern
+
+    def cache_info(self):
+        return RegexCacheInfo(self.hits, self.misses, self.maxsize, len(self._patterns))
+
+    def cache_clear(self):
+        with self._lock:
+            self._patterns.clear()
+            self._last_used.clear()
+            self.hits = self.misses = 0
+
+
+if lru_cache is not None:
+    _compile_regex = lru_cache(maxsize=REGEX_CACHE_SIZE)(re.compile)
+else:
+    _compile_regex = _RegexCache(REGEX_CACHE_SIZE)
+
+
+def regex_cache_info():
+    """
+    Returns a named tuple of the `hits`, `misses`, `maxsize` and `currsize` of
+    the cache of compiled regular expressions shared by `Regexp` validators.
+    """
+    return RegexCacheInfo(*_compile_regex.cache_info())
+
+
+def clear_regex_cache():
+    """
+    Empties the cache of compiled regular expressions and resets its
+    statistics.
+    """
+    _compile_regex.cache_clear()
+
+
 class ValidationError(ValueError):
     """
     Raised when a validator fails to validate its input.
@@ -87,8 +173,7 @@ class Length(object):
         self.message = message
 
     def __call__(self, form, field):
-        l = field.data and len(field.data) or 0
-        if l < self.min or self.max != -1 and l > self.max:
+        if not self.is_valid(field.data):
             if self.message is None:
                 if self.max == -1:
                     self.message = field.ngettext('Field must be at least %(min)d character long.',
@@ -101,6 +186,14 @@ class Length(object):
 
             raise ValidationError(self.message % dict(min=self.min, max=self.max))
 
+    def is_valid(self, value):
+        """
+        Returns `True` if `value` is of an allowed length, without building
+        any error message.
+        """
+        l = value and len(value) or 0
+        return not (l < self.min or self.max != -1 and l > self.max)
+
 
 class NumberRange(object):
     """
@@ -125,9 +218,7 @@ class NumberRange(object):
         self.message = message
 
     def __call__(self, form, field):
-        data = field.data
-        if data is None or (self.min is not None and data < self.min) or \
-            (self.max is not None and data > self.max):
+        if not self.is_valid(field.data):
             if self.message is None:
                 # we use %(min)s interpolation to support floats, None, and
                 # Decimals without throwing a formatting exception.
@@ -140,6 +231,14 @@ class NumberRange(object):
 
             raise ValidationError(self.message % dict(min=self.min, max=self.max))
 
+    def is_valid(self, value):
+        """
+        Returns `True` if `value` is within the range, without building any
+        error message.
+        """
+        return not (value is None or (self.min is not None and value < self.min) or
+                    (self.max is not None and value > self.max))
+
 
 class Optional(object):
     """
@@ -229,17 +328,24 @@ class Regexp(object):
     """
     def __init__(self, regex, flags=0, message=None):
         if isinstance(regex, string_types):
-            regex = re.compile(regex, flags)
+            regex = _compile_regex(regex, flags)
         self.regex = regex
         self.message = message
 
     def __call__(self, form, field):
-        if not self.regex.match(field.data or ''):
+        if not self.is_valid(field.data):
             if self.message is None:
                 self.message = field.gettext('Invalid input.')
 
             raise ValidationError(self.message)
 
+    def is_valid(self, value):
+        """
+        Returns `True` if `value` matches the regexp, without building any
+        error message.
+        """
+        return self.regex.match(value or '') is not None
+
 
 class Email(Regexp):
     """
@@ -254,10 +360,11 @@ class Email(Regexp):
         super(Email, self).__init__(r'^.+@[^.].*\.[a-z]{2,10}$', re.IGNORECASE, message)
 
     def __call__(self, form, field):
-        if self.message is None:
-            self.message = field.gettext('Invalid email address.')
+        if not self.is_valid(field.data):
+            if self.message is None:
+                self.message = field.gettext('Invalid email address.')
 
-        super(Email, self).__call__(form, field)
+            raise ValidationError(self.message)
 
 
 class IPAddress(object):
@@ -274,25 +381,28 @@ class IPAddress(object):
         self.message = message
 
     def __call__(self, form, field):
-        value = field.data
-        valid = False
-        if value:
-            valid = self.check_ipv4(value)
-
-            if not valid and self.ipv6:
-                valid = self.check_ipv6(value)
-
-        if not valid:
+        if not self.is_valid(field.data):
             if self.message is None:
                 self.message = field.gettext('Invalid IP address.')
             raise ValidationError(self.message)
 
+    def is_valid(self, value):
+        """
+        Returns `True` if `value` is a valid address, without building any
+        error message.
+        """
+        if not value:
+            return False
+        return self.check_ipv4(value) or self.ipv6 and self.check_ipv6(value)
+
     def check_ipv4(self, value):
         parts = value.split('.')
-        if len(parts) == 4 and all(x.isdigit() for x in parts):
-            numbers = list(int(x) for x in parts)
-            return all(num >= 0 and num < 256 for num in numbers)
-        return False
+        if len(parts) != 4:
+            return False
+        for part in parts:
+            if not part.isdigit() or int(part) > 255:
+                return False
+        return True
 
     def check_ipv6(self, value):
         parts = value.split(':')
@@ -331,10 +441,11 @@ class MacAddress(Regexp):
         super(MacAddress, self).__init__(pattern, message=message)
 
     def __call__(self, form, field):
-        if self.message is None:
-            self.message = field.gettext('Invalid Mac address.')
+        if not self.is_valid(field.data):
+            if self.message is None:
+                self.message = field.gettext('Invalid Mac address.')
 
-        super(MacAddress, self).__call__(form, field)
+            raise ValidationError(self.message)
 
 
 class URL(Regexp):
@@ -356,10 +467,11 @@ class URL(Regexp):
         super(URL, self).__init__(regex, re.IGNORECASE, message)
 
     def __call__(self, form, field):
-        if self.message is None:
-            self.message = field.gettext('Invalid URL.')
+        if not self.is_valid(field.data):
+            if self.message is None:
+                self.message = field.gettext('Invalid URL.')
 
-        super(URL, self).__call__(form, field)
+            raise ValidationError(self.message)
 
 
 class UUID(Regexp):
@@ -374,10 +486,11 @@ class UUID(Regexp):
         super(UUID, self).__init__(pattern, message=message)
 
     def __call__(self, form, field):
-        if self.message is None:
-            self.message = field.gettext('Invalid UUID.')
+        if not self.is_valid(field.data):
+            if self.message is None:
+                self.message = field.gettext('Invalid UUID.')
 
-        super(UUID, self).__call__(form, field)
+            raise ValidationError(self.message)
 
 
 class AnyOf(object):
@@ -400,12 +513,19 @@ class AnyOf(object):
         self.values_formatter = values_formatter
 
     def __call__(self, form, field):
-        if field.data not in self.values:
+        if not self.is_valid(field.data):
             if self.message is None:
                 self.message = field.gettext('Invalid value, must be one of: %(values)s.')
 
             raise ValueError(self.message % dict(values=self.values_formatter(self.values)))
 
+    def is_valid(self, value):
+        """
+        Returns `True` if `value` is one of the valid inputs, without building
+        any error message.
+        """
+        return value in self.values
+
 
 class NoneOf(object):
     """
@@ -427,12 +547,19 @@ class NoneOf(object):
         self.values_formatter = values_formatter
 
     def __call__(self, form, field):
-        if field.data in self.values:
+        if not self.is_valid(field.data):
             if self.message is None:
                 self.message = field.gettext('Invalid value, can\'t be any of: %(values)s.')
 
             raise ValueError(self.message % dict(values=self.values_formatter(self.values)))
 
+    def is_valid(self, value):
+        """
+        Returns `True` if `value` is not one of the invalid inputs, without
+        building any error message.
+        """
+        return value not in self.values
+
 
 email = Email
 equal_to = EqualTo
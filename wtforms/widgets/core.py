@@ -11,6 +11,25 @@ __all__ = (
 )
 
 
+#: Attribute names which are never looked up in the fragment cache, because
+#: their values usually come from user input.
+UNCACHED_ATTRIBUTES = frozenset(['value'])
+
+#: Maximum number of serialized attributes kept by `html_params`.
+ATTRIBUTE_CACHE_SIZE = 4096
+
+_attribute_cache = {}
+_cacheable_types = frozenset([text_type, str])
+_renamed_attributes = {'class_': 'class', 'class__': 'class_', 'for_': 'for'}
+
+
+def _serialize_attribute(k, v):
+    k = _renamed_attributes.get(k, k)
+    if v is True:
+        return k
+    return '%s="%s"' % (text_type(k), escape(text_type(v), quote=True))
+
+
 def html_params(**kwargs):
     """
     Generate HTML parameters from inputted keyword arguments.
@@ -20,17 +39,27 @@ def html_params(**kwargs):
     frequent use of the normally reserved keywords `class` and `for`, suffixing
     these with an underscore will allow them to be used.
 
+    Serialized attributes with plain string values are cached, so the id,
+    name, type and class attributes repeated on every render are only escaped
+    once.
+
     >>> html_params(name='text1', id='f', class_='text') == 'class="text" id="f" name="text1"'
     True
     """
     params = []
-    for k,v in sorted(iteritems(kwargs)):
-        if k in ('class_', 'class__', 'for_'):
-            k = k[:-1]
-        if v is True:
-            params.append(k)
+    cache = _attribute_cache
+    for k, v in sorted(iteritems(kwargs)):
+        if type(v) in _cacheable_types and k not in UNCACHED_ATTRIBUTES:
+            try:
+                params.append(cache[(k, v)])
+                continue
+            except KeyError:
+                if len(cache) >= ATTRIBUTE_CACHE_SIZE:
+                    cache.clear()
+                param = cache[(k, v)] = _serialize_attribute(k, v)
         else:
-            params.append('%s="%s"' % (text_type(k), escape(text_type(v), quote=True)))
+            param = _serialize_attribute(k, v)
+        params.append(param)
     return ' '.join(params)
 
 
@@ -39,6 +68,76 @@ class HTMLString(text_type):
         return self
 
 
+def _defining_class(cls, name):
+    """ Return the class in the MRO of `cls` which defines `name`. """
+    for klass in cls.__mro__:
+        if name in klass.__dict__:
+            return klass
+    return None
+
+
+def _get_iter_render(widget):
+    """
+    Return the `iter_render` method of `widget`, or `None` if it has none or
+    its `__call__` is overridden in a subclass of the class providing
+    `iter_render`, in which case the chunks wouldn't match its output.
+    """
+    iter_render = getattr(widget, 'iter_render', None)
+    if iter_render is not None:
+        mro = type(widget).__mro__
+        call_class = _defining_class(type(widget), '__call__')
+        render_class = _defining_class(type(widget), 'iter_render')
+        if render_class is not None and call_class is not None and mro.index(call_class) < mro.index(render_class):
+            return None
+    return iter_render
+
+
+#: The methods a field is rendered with when it is converted to text.
+_TEXT_METHODS = ('__str__', '__unicode__', '__html__')
+
+# Whether each class of field overrides any of `_TEXT_METHODS`, for at most
+# 256 classes.
+_text_overrides = {}
+
+
+def _overrides(field, names):
+    """
+    Returns `True` if the class of `field` overrides any of the methods
+    `names` of `Field`, or isn't a field at all.
+    """
+    from wtforms.fields.core import Field
+
+    for name in names:
+        if getattr(type(field), name, None) != getattr(Field, name, None):
+            return True
+    return False
+
+
+def _iter_field(field, as_text=False):
+    """
+    Yield the HTML of `field` in chunks, using its `iter_render` method if it
+    has one.
+
+    If `as_text` is True, the field is rendered as `text_type(field)` would,
+    so a field which overrides the methods used for that is rendered by them
+    in one chunk.
+    """
+    if as_text:
+        field_type = type(field)
+        try:
+            overridden = _text_overrides[field_type]
+        except KeyError:
+            if len(_text_overrides) >= 256:
+                _text_overrides.clear()
+            overridden = _text_overrides[field_type] = _overrides(field, _TEXT_METHODS)
+        if overridden:
+            return iter((text_type(field), ))
+    iter_render = getattr(field, 'iter_render', None)
+    if iter_render is None:
+        return iter((text_type(field()), ))
+    return iter_render()
+
+
 class ListWidget(object):
     """
     Renders a list of fields as a `ul` or `ol` list.
@@ -57,15 +156,26 @@ class ListWidget(object):
         self.prefix_label = prefix_label
 
     def __call__(self, field, **kwargs):
+        return HTMLString(''.join(self.iter_render(field, **kwargs)))
+
+    def iter_render(self, field, **kwargs):
+        """
+        Yield the HTML of the list in chunks, rendering one subfield at a time.
+        """
         kwargs.setdefault('id', field.id)
-        html = ['<%s %s>' % (self.html_tag, html_params(**kwargs))]
+        yield '<%s %s>' % (self.html_tag, html_params(**kwargs))
         for subfield in field:
             if self.prefix_label:
-                html.append('<li>%s: %s</li>' % (subfield.label, subfield()))
+                yield '<li>%s: ' % text_type(subfield.label)
+                for chunk in _iter_field(subfield):
+                    yield chunk
+                yield '</li>'
             else:
-                html.append('<li>%s %s</li>' % (subfield(), subfield.label))
-        html.append('</%s>' % self.html_tag)
-        return HTMLString(''.join(html))
+                yield '<li>'
+                for chunk in _iter_field(subfield):
+                    yield chunk
+                yield ' %s</li>' % text_type(subfield.label)
+        yield '</%s>' % self.html_tag
 
 
 class TableWidget(object):
@@ -78,27 +188,160 @@ class TableWidget(object):
     Hidden fields will not be displayed with a row, instead the field will be 
     pushed into a subsequent table row to ensure XHTML validity. Hidden fields
     at the end of the field list will appear outside the table.
+
+    If `cache_template` is True, the rendered HTML is compiled into a
+    template the first time a given set of fields is rendered, with slots
+    for the values of text, password, hidden and textarea inputs. Later
+    renders only fill in the slots, and render any other fields in full. The
+    template is keyed by the type, widget, name, id and label of every field
+    and by the keyword arguments, so changing any of those compiles a new
+    one. Since a form can be iterated for its fields, this can also render
+    a whole form, e.g. ``TableWidget(with_table_tag=False, cache_template=True)(form)``.
     """
-    def __init__(self, with_table_tag=True):
+    #: Maximum number of compiled templates kept when `cache_template` is set.
+    cache_size = 64
+    cache_template = False
+
+    def __init__(self, with_table_tag=True, cache_template=False):
         self.with_table_tag = with_table_tag
+        self.cache_template = cache_template
+        self._templates = {}
 
     def __call__(self, field, **kwargs):
-        html = []
+        return HTMLString(''.join(self.iter_render(field, **kwargs)))
+
+    def iter_render(self, field, **kwargs):
+        """
+        Yield the HTML of the table in chunks, rendering one row at a time.
+        """
+        if self.cache_template:
+            return self._iter_render_cached(field, kwargs)
+        return self._iter_render(field, kwargs)
+
+    def _iter_render(self, field, kwargs):
         if self.with_table_tag:
-            kwargs.setdefault('id', field.id)
-            html.append('<table %s>' % html_params(**kwargs))
-        hidden = ''
+            if 'id' not in kwargs:
+                kwargs['id'] = field.id
+            yield '<table %s>' % html_params(**kwargs)
+        hidden = []
         for subfield in field:
             if subfield.type == 'HiddenField':
-                hidden += text_type(subfield)
+                hidden.extend(_iter_field(subfield, as_text=True))
+            else:
+                yield '<tr><th>%s</th><td>' % text_type(subfield.label)
+                for chunk in hidden:
+                    yield chunk
+                hidden = []
+                for chunk in _iter_field(subfield, as_text=True):
+                    yield chunk
+                yield '</td></tr>'
+        if self.with_table_tag:
+            yield '</table>'
+        for chunk in hidden:
+            yield chunk
+
+    def _iter_render_cached(self, field, kwargs):
+        if self.with_table_tag and 'id' not in kwargs:
+            kwargs['id'] = field.id
+        subfields = list(field)
+        key = (
+            tuple(sorted(iteritems(kwargs))),
+            tuple(
+                (type(f), f.type, f.widget, f.name, f.id, type(f.label), f.label.text)
+                for f in subfields
+            ),
+        )
+        try:
+            template = self._templates.get(key)
+        except TypeError:
+            # Unhashable keyword arguments or labels can't be cached.
+            template = key = None
+
+        if template is None:
+            template = self._compile(subfields, kwargs)
+            if key is not None:
+                if len(self._templates) >= self.cache_size:
+                    self._templates.clear()
+                self._templates[key] = template
+
+        for part in template:
+            if type(part) is tuple:
+                index, quote = part
+                if quote is None:
+                    for chunk in _iter_field(subfields[index], as_text=True):
+                        yield chunk
+                else:
+                    yield escape(text_type(subfields[index]._value()), quote=quote)
+            else:
+                yield part
+
+    def _compile(self, subfields, kwargs):
+        """
+        Compile a template for `subfields`, as a list of static HTML strings
+        and `(index, quote)` slots. A slot with `quote=None` renders the whole
+        field, otherwise it holds the escaped value of the field.
+        """
+        parts = []
+        if self.with_table_tag:
+            parts.append('<table %s>' % html_params(**kwargs))
+        hidden = []
+        for index, subfield in enumerate(subfields):
+            if subfield.type == 'HiddenField':
+                hidden.extend(_compile_field(index, subfield))
             else:
-                html.append('<tr><th>%s</th><td>%s%s</td></tr>' % (text_type(subfield.label), hidden, text_type(subfield)))
-                hidden = ''
+                parts.append('<tr><th>%s</th><td>' % text_type(subfield.label))
+                parts.extend(hidden)
+                parts.extend(_compile_field(index, subfield))
+                parts.append('</td></tr>')
+                hidden = []
         if self.with_table_tag:
-            html.append('</table>')
-        if hidden:
-            html.append(hidden)
-        return HTMLString(''.join(html))
+            parts.append('</table>')
+        parts.extend(hidden)
+
+        # Merge adjacent static strings.
+        template = []
+        for part in parts:
+            if template and type(part) is not tuple and type(template[-1]) is not tuple:
+                template[-1] += part
+            else:
+                template.append(part)
+        return template
+
+
+_VALUE_SLOT = '\x00value\x00'
+
+
+class _ValueSlotField(object):
+    """
+    Stands in for a field while compiling a template, returning a marker in
+    place of its value.
+    """
+    def __init__(self, field):
+        self._field = field
+
+    def __getattr__(self, name):
+        return getattr(self._field, name)
+
+    def _value(self):
+        return _VALUE_SLOT
+
+
+def _compile_field(index, field):
+    """
+    Return the template parts rendering `field`, with slots for its value if
+    its widget renders the value exactly once in an attribute or element body.
+    """
+    widget_type = type(field.widget)
+    if widget_type not in _SLOTTED_WIDGETS or _overrides(field, ('__call__', ) + _TEXT_METHODS):
+        return [(index, None)]
+
+    pieces = text_type(field.widget(_ValueSlotField(field))).split(_VALUE_SLOT)
+    quote = widget_type is not TextArea
+    parts = [pieces[0]]
+    for piece in pieces[1:]:
+        parts.append((index, quote))
+        parts.append(piece)
+    return parts
 
 
 class Input(object):
@@ -231,22 +474,82 @@ class Select(object):
     If `multiple` is True, then the `size` property should be specified on
     rendering to make the field useful.
 
+    If `cache_options` is True, the rendered HTML of each option is memoized
+    per choices object, so rendering a field with a large static choices list
+    only has to pick the selected or unselected version of each option. Lists
+    modified in place are detected, but labels are cached as rendered, so
+    this should not be used with lazily translated labels.
+
     The field must provide an `iter_choices()` method which the widget will
     call on rendering; this method must yield tuples of
     `(value, label, selected)`.
     """
-    def __init__(self, multiple=False):
+    #: Maximum number of choices objects to keep rendered options for.
+    cache_size = 128
+    cache_options = False
+
+    def __init__(self, multiple=False, cache_options=False):
         self.multiple = multiple
+        self.cache_options = cache_options
+        self._rendered = {}
 
     def __call__(self, field, **kwargs):
+        return HTMLString(''.join(self.iter_render(field, **kwargs)))
+
+    def iter_render(self, field, **kwargs):
+        """
+        Yield the HTML of the select in chunks, one option at a time.
+        """
         kwargs.setdefault('id', field.id)
         if self.multiple:
             kwargs['multiple'] = True
-        html = ['<select %s>' % html_params(name=field.name, **kwargs)]
-        for val, label, selected in field.iter_choices():
-            html.append(self.render_option(val, label, selected))
-        html.append('</select>')
-        return HTMLString(''.join(html))
+        yield '<select %s>' % html_params(name=field.name, **kwargs)
+        for option in self._iter_options(field):
+            yield option
+        yield '</select>'
+
+    def _get_rendered_options(self, choices):
+        """
+        Return a `(choices, rendered)` pair, where `rendered` holds an
+        `(unselected, selected)` pair of HTML strings for each item in the
+        `choices` sequence, or is empty if there are no rendered options.
+        """
+        if hasattr(choices, 'rendered_options'):
+            return choices, choices.rendered_options(self.render_option)
+        if not self.cache_options or not hasattr(choices, '__len__'):
+            return (), ()
+
+        key = id(choices)
+        entry = self._rendered.get(key)
+        if entry is None or entry[0] is not choices or len(entry[1]) != len(choices):
+            if len(self._rendered) >= self.cache_size:
+                self._rendered.clear()
+            # Keep a snapshot of the items so that choices replaced in place
+            # are not matched against stale HTML.
+            items = tuple(choices)
+            rendered = tuple(
+                (self.render_option(value, label, False), self.render_option(value, label, True))
+                for value, label in items
+            )
+            entry = self._rendered[key] = (choices, items, rendered)
+        return entry[1], entry[2]
+
+    def _iter_options(self, field):
+        """
+        Yield the HTML of each option of `field`.
+
+        Pre-rendered options (see `cache_options` and `wtforms.fields.Choices`)
+        are used for every choice yielded unchanged by `iter_choices`.
+        """
+        items, rendered = self._get_rendered_options(getattr(field, 'choices', None))
+        num_rendered = len(rendered)
+
+        render_option = self.render_option
+        for i, (val, label, selected) in enumerate(field.iter_choices()):
+            if i < num_rendered and val is items[i][0] and label is items[i][1]:
+                yield rendered[i][1] if selected else rendered[i][0]
+            else:
+                yield render_option(val, label, selected)
 
     @classmethod
     def render_option(cls, value, label, selected, **kwargs):
@@ -262,7 +565,32 @@ class Option(object):
 
     This is just a convenience for various custom rendering situations, and an
     option by itself does not constitute an entire field.
+
+    If `cache_options` is True, options rendered without extra keyword
+    arguments are memoized by value, label and selected state.
     """
-    def __call__(self, field, **kwargs):
-        return Select.render_option(field._value(), field.label.text, field.checked, **kwargs)
+    #: Maximum number of rendered options to keep when caching.
+    cache_size = 10000
+    cache_options = False
+
+    def __init__(self, cache_options=False):
+        self.cache_options = cache_options
+        self._rendered = {}
 
+    def __call__(self, field, **kwargs):
+        if not self.cache_options or kwargs:
+            return Select.render_option(field._value(), field.label.text, field.checked, **kwargs)
+
+        value, label, checked = field._value(), field.label.text, bool(field.checked)
+        try:
+            return self._rendered[(value, label, checked)]
+        except KeyError:
+            if len(self._rendered) >= self.cache_size:
+                self._rendered.clear()
+            html = self._rendered[(value, label, checked)] = Select.render_option(value, label, checked)
+            return html
+        except TypeError:
+            return Select.render_option(value, label, checked)
+
+
+_SLOTTED_WIDGETS = frozenset([TextInput, PasswordInput, HiddenInput, TextArea])